@@ -0,0 +1,109 @@
+"""
+Сравнение горячего пути экзаменатора: прежняя общая asyncio.Lock вокруг выдачи студента,
+выбора вопросов и записи статистики против диспетчера без блокировок (собственная очередь deque).
+Экзамен моделируется в виртуальном времени, поэтому измеряются только накладные расходы.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_dispatcher --examiners 100 300 1000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from s21_examing import Exam, ExamManager, VirtualClock
+from benchmarks.synthetic import make_questions, make_roster
+
+
+class LockedExamManager(ExamManager):
+    """Прежняя схема: каждое обращение к общим данным под одной блокировкой"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lock = asyncio.Lock()
+        self.lock_waits = 0
+
+    async def acquire(self) -> None:
+        """Берёт блокировку, считая случаи, когда её пришлось ждать"""
+        if self.lock.locked():
+            self.lock_waits += 1
+        await self.lock.acquire()
+
+    async def make_exam_slot_a(self, examiner, number: int = 0) -> None:
+        questions_bank = self._ExamManager__questions
+        lunch_flag = 0
+        while True:
+            current_time = self.statistics.get_examiner_work_time(examiner)
+            if lunch_flag:
+                self.statistics.set_examiner_have_luch(examiner, False)
+
+            if current_time >= 30.0 and not lunch_flag:
+                lunch_flag = 1
+                self.statistics.set_examiner_have_luch(examiner, True)
+                await self.clock.sleep(random.uniform(12, 18))
+                continue
+
+            await self.acquire()
+            try:
+                student = self.get_student()
+                self.statistics.assign_student_to_examiner(examiner, student)
+                if not student:
+                    return
+                questions = questions_bank.sample(3)
+            finally:
+                self.lock.release()
+
+            time_spent_sec = random.uniform(*self.get_len_exam(examiner))
+            res_list = []
+            for question in questions:
+                answer = Exam(examiner, student, questions_bank.tokens(question)).check_answer()
+                if answer:
+                    await self.acquire()
+                    try:
+                        self.statistics.make_questions_dict(question)
+                    finally:
+                        self.lock.release()
+                res_list.append(answer)
+            rand = random.random()
+            result = False if rand < 0.125 else True if rand < 0.25 else res_list.count(True) > res_list.count(False)
+
+            await self.clock.sleep(time_spent_sec)
+
+            await self.acquire()
+            try:
+                self.statistics.update_examiner_stats(examiner, result, time_spent_sec)
+                self.statistics.update_student_stats(student, result, time_spent_sec)
+                self.statistics.num_student_in_queue -= 1
+            finally:
+                self.lock.release()
+
+
+def run(manager_class, examiners, students, questions, seed) -> tuple[float, int]:
+    """Возвращает время (в секундах) полного экзамена в виртуальном времени и число ожиданий блокировки"""
+    random.seed(seed)
+    manager = manager_class(examiners, students, questions, clock=VirtualClock())
+    started = time.perf_counter()
+    asyncio.run(manager.run_exam())
+    return time.perf_counter() - started, getattr(manager, 'lock_waits', 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--examiners", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--students-per-examiner", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    questions = make_questions(100)
+    print(f"{'экзаменаторов':>13} | {'студентов':>9} | {'Lock':>9} | {'ожиданий Lock':>13} | {'Диспетчер':>9} | {'выигрыш':>7}")
+    for count in args.examiners:
+        examiners = make_roster(count, seed=1)
+        students = make_roster(count * args.students_per_examiner)
+        locked, waits = run(LockedExamManager, examiners, students, questions, args.seed)
+        dispatched, _ = run(ExamManager, examiners, students, questions, args.seed)
+        print(f"{count:>13} | {len(students):>9} | {locked:>7.2f} с | {waits:>13} | {dispatched:>7.2f} с | "
+              f"{locked / dispatched:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
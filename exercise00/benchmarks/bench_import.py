@@ -0,0 +1,52 @@
+"""
+Время импорта пакета s21_examing в новом процессе: ядро моделирования
+против ядра с отрисовкой (rich) и пакетной проверкой (numpy).
+Каждый замер — отдельный процесс интерпретатора, выводится медиана.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_import --runs 20
+"""
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+
+STATEMENTS = {
+    "ядро": "import s21_examing",
+    "ядро + отрисовка": "import s21_examing; import s21_examing.presentation",
+    "ядро + numpy": "from s21_examing import check_answers_batch",
+}
+
+PROBE = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules),
+                  "rich": "rich" in sys.modules, "numpy": "numpy" in sys.modules}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Импортирует пакет в новом процессе и возвращает время импорта и загруженные модули"""
+    output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'импорт':>18} | {'медиана':>10} | {'модулей':>7} | {'rich':>5} | {'numpy':>5}")
+    for title, statement in STATEMENTS.items():
+        runs = [measure(statement) for _ in range(args.runs)]
+        last = runs[-1]
+        print(f"{title:>18} | {median(run['seconds'] for run in runs) * 1000:>7.1f} мс | {last['modules']:>7} | "
+              f"{'да' if last['rich'] else 'нет':>5} | {'да' if last['numpy'] else 'нет':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Сравнение выбора слов без возвращения: список с пересчётом весов и list.remove
+против WordSampler (дерево Фенвика) на вопросах из 100–1000 слов.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_sampling
+"""
+import argparse
+import random
+import timeit
+
+from s21_examing import Exam, Person
+from s21_examing.question_bank import golden_weights
+from s21_examing.sampling import WordSampler
+
+
+def make_words(length: int, vocabulary: int = 50) -> list:
+    """Возвращает вопрос из length слов с повторами"""
+    return [f"слово{random.randrange(vocabulary)}" for _ in range(length)]
+
+
+def drain_list(words: list) -> list:
+    """Прежняя схема: веса пересчитываются по укороченному списку на каждом шаге"""
+    question = list(words)
+    order = []
+    while question:
+        weights = golden_weights(len(question))
+        word = random.choices(question, weights=weights, k=1)[0]
+        order.append(word)
+        question.remove(word)
+    return order
+
+
+def drain_sampler(words: list) -> list:
+    """Новая схема: выбор и удаление через WordSampler"""
+    sampler = WordSampler(list(words))
+    order = []
+    while sampler:
+        word = sampler.draw()
+        order.append(word)
+        sampler.remove(word)
+    return order
+
+
+def examiner_answer_list(words: list) -> list:
+    """Прежний get_examiner_answer (с правилом остановки 2/3)"""
+    question = list(words)
+    answer = [random.choices(question, weights=golden_weights(len(question)), k=1)[0]]
+    while question:
+        if random.random() < 2 / 3:
+            break
+        question.remove(answer[-1])
+        if question:
+            answer.append(random.choices(question, weights=golden_weights(len(question)), k=1)[0])
+    return answer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 250, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    examiner = Person("Степан", "М")
+    student = Person("Петр", "М")
+
+    print(f"{'слов':>6} | {'полный выбор, список':>21} | {'полный выбор, Фенвик':>21} | "
+          f"{'ответ экзаменатора, список':>27} | {'ответ экзаменатора, Фенвик':>27}")
+    for length in args.lengths:
+        words = make_words(length)
+        drains = max(1, 2000 // length)
+        answers = 2000
+
+        drain_old = min(timeit.repeat(lambda: drain_list(words), number=drains, repeat=args.repeat)) / drains
+        drain_new = min(timeit.repeat(lambda: drain_sampler(words), number=drains, repeat=args.repeat)) / drains
+        answer_old = min(timeit.repeat(lambda: examiner_answer_list(words),
+                                       number=answers, repeat=args.repeat)) / answers
+        answer_new = min(timeit.repeat(lambda: Exam(examiner, student, words).get_examiner_answer(),
+                                       number=answers, repeat=args.repeat)) / answers
+
+        print(f"{length:>6} | {drain_old * 1e3:>18.3f} мс | {drain_new * 1e3:>18.3f} мс | "
+              f"{answer_old * 1e6:>24.1f} мкс | {answer_new * 1e6:>24.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
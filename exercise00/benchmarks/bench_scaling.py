@@ -0,0 +1,187 @@
+"""
+Масштабный прогон s21_examing на синтетических списках от 10^2 до 10^6 записей.
+Замеры: чтение списка из файла (FileReader), создание Person, check_answer,
+обновление статистики, отрисовка таблиц и полный run_exam на виртуальных часах.
+
+Результаты пишутся в JSON (базовая линия), который можно сравнить с прогоном
+другой версии кода через --compare.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_scaling --output baseline.json
+    python -m benchmarks.bench_scaling --output new.json --compare baseline.json
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from rich.console import Console
+
+from s21_examing import Exam, ExamManager, ExamStatistics, FileReader, Person, QuestionBank, VirtualClock
+from benchmarks.synthetic import make_questions, make_roster
+
+MEASURES = ('parse_roster', 'person_construction', 'check_answer', 'stats_updates', 'render_tables', 'run_exam')
+
+
+def timed(function, *args) -> tuple[float, object]:
+    """Возвращает время выполнения функции (в секундах) и её результат"""
+    started = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - started, result
+
+
+def bench_parse_roster(roster) -> float:
+    """Чтение списка студентов из текстового файла"""
+    with tempfile.NamedTemporaryFile('w', encoding='UTF-8', suffix='.txt', delete=False) as file:
+        file.writelines(f"{first} {last}\n" for first, last in roster)
+    try:
+        elapsed, persons = timed(FileReader(file.name).read_persons)
+    finally:
+        os.remove(file.name)
+    assert len(persons) == len(roster)
+    return elapsed
+
+
+def bench_check_answer(examiners, students, bank, rng) -> float:
+    """Проверка ответов: по одному вопросу на каждого студента"""
+    pairs = [(rng.choice(examiners), student, bank.tokens(rng.choice(bank))) for student in students]
+    started = time.perf_counter()
+    for examiner, student, question in pairs:
+        Exam(examiner, student, question).check_answer()
+    return time.perf_counter() - started
+
+
+def bench_stats_updates(examiners, students, bank, rng) -> tuple[float, ExamStatistics]:
+    """Обновление статистики так, как это делает экзаменатор после каждого студента"""
+    statistics = ExamStatistics(deque(students), deque(examiners))
+    updates = [(rng.choice(examiners), student, rng.random() < 0.5, rng.uniform(1, 10), rng.choice(bank))
+               for student in students]
+    started = time.perf_counter()
+    for examiner, student, result, time_spent, question in updates:
+        statistics.assign_student_to_examiner(examiner, student)
+        statistics.make_questions_dict(question)
+        statistics.update_examiner_stats(examiner, result, time_spent)
+        statistics.update_student_stats(student, result, time_spent)
+        statistics.num_student_in_queue -= 1
+    return time.perf_counter() - started, statistics
+
+
+def bench_render_tables(statistics: ExamStatistics, frames: int) -> float:
+    """Среднее время одного кадра: таблицы экзамена и итоговая таблица"""
+    console = Console(file=io.StringIO(), width=120, force_terminal=True)
+    started = time.perf_counter()
+    for _ in range(frames):
+        console.print(statistics.get_layout())
+        console.file.seek(0)
+        console.file.truncate()
+    return (time.perf_counter() - started) / frames
+
+
+def bench_run_exam(examiner_records, student_records, questions, seed) -> float:
+    """Полный экзамен на виртуальных часах"""
+    random.seed(seed)
+    manager = ExamManager(examiner_records, student_records, questions, clock=VirtualClock())
+    elapsed, _ = timed(asyncio.run, manager.run_exam())
+    assert manager.statistics.total_students == len(student_records)
+    return elapsed
+
+
+def run_size(size: int, args) -> dict:
+    """Прогоняет все замеры для одного размера и возвращает {замер: {seconds, per_sec}}"""
+    rng = random.Random(args.seed)
+    examiner_records = make_roster(args.examiners, seed=1)
+    student_records = make_roster(size, seed=args.seed)
+    questions = make_questions(size, seed=args.seed)
+    results = {}
+
+    def record(name, seconds, count=size):
+        results[name] = {"seconds": round(seconds, 6), "per_sec": round(count / seconds, 1) if seconds else None}
+
+    record('parse_roster', bench_parse_roster(student_records))
+    elapsed, students = timed(ExamManager.make_queue, student_records)
+    record('person_construction', elapsed)
+    examiners = [Person(*record) for record in examiner_records]
+    bank = QuestionBank(questions)
+    record('check_answer', bench_check_answer(examiners, students, bank, rng))
+    elapsed, statistics = bench_stats_updates(examiners, students, bank, rng)
+    record('stats_updates', elapsed)
+    record('render_tables', bench_render_tables(statistics, args.frames), count=1)
+    if size <= args.exam_limit:
+        record('run_exam', bench_run_exam(examiner_records, student_records, bank, args.seed))
+    return results
+
+
+def git_revision() -> str | None:
+    """Возвращает текущий коммит, если код лежит в git-репозитории"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Печатает отношение времени текущего прогона к базовой линии (меньше 1 — быстрее)"""
+    print(f"\nСравнение с {baseline['meta'].get('revision') or 'базовой линией'} (текущее / базовое время):")
+    print(f"{'размер':>8} | " + " | ".join(f"{name:>19}" for name in MEASURES))
+    for size, measures in current['results'].items():
+        old = baseline['results'].get(size, {})
+        cells = []
+        for name in MEASURES:
+            if name in measures and name in old and old[name]['seconds']:
+                cells.append(f"{measures[name]['seconds'] / old[name]['seconds']:>18.2f}x")
+            else:
+                cells.append(f"{'—':>19}")
+        print(f"{size:>8} | " + " | ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10 ** power for power in range(2, 7)])
+    parser.add_argument("--examiners", type=int, default=100)
+    parser.add_argument("--exam-limit", type=int, default=10 ** 5,
+                        help="максимальный размер, для которого моделируется полный run_exam")
+    parser.add_argument("--frames", type=int, default=20, help="число кадров для замера отрисовки")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join(os.path.dirname(__file__), "bench_scaling.json"),
+                        help="куда записать результаты в JSON (по умолчанию — в каталог benchmarks)")
+    parser.add_argument("--compare", metavar="PATH", help="базовая линия для сравнения")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "examiners": args.examiners,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    print(f"{'размер':>8} | " + " | ".join(f"{name:>19}" for name in MEASURES))
+    for size in args.sizes:
+        measures = run_size(size, args)
+        report["results"][str(size)] = measures
+        print(f"{size:>8} | " + " | ".join(
+            f"{measures[name]['seconds']:>17.4f} с" if name in measures else f"{'—':>19}" for name in MEASURES))
+
+    with open(args.output, 'w', encoding='UTF-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"\nРезультаты записаны в {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='UTF-8') as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Сравнение политик распределения студентов: длительность экзамена (makespan)
+и загрузка экзаменаторов на больших синтетических списках.
+
+makespan по часам — момент окончания последнего экзамена с учётом обедов,
+get_exam_time — максимум времени работы экзаменатора (без обедов), как в итогах экзамена.
+Загрузка — доля времени работы экзаменаторов от makespan по часам.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_scheduling --students 10000 100000 --examiners 50
+"""
+import argparse
+import asyncio
+import random
+from statistics import mean
+
+from s21_examing import ExamManager, VirtualClock
+from s21_examing.scheduling import POLICIES
+from benchmarks.synthetic import make_questions, make_roster
+
+
+def run_policy(policy_class, examiners, students, questions, seed) -> dict:
+    """Моделирует экзамен с политикой и возвращает показатели"""
+    random.seed(seed)
+    clock = VirtualClock()
+    manager = ExamManager(examiners, students, questions, clock=clock, policy=policy_class())
+    asyncio.run(manager.run_exam())
+
+    statistics = manager.statistics
+    makespan = clock.now()
+    worked = [stats.time_worked for stats in statistics.examiners_stats.values()]
+    return {
+        "makespan": makespan,
+        "exam_time": statistics.get_exam_time(),
+        "utilisation": sum(worked) / (len(worked) * makespan) if makespan else 0.0,
+        "examined": statistics.total_students,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--examiners", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    examiners = make_roster(args.examiners, seed=1)
+    questions = make_questions(100)
+    print(f"{'студентов':>10} | {'политика':>15} | {'makespan (часы)':>16} | {'get_exam_time':>14} | {'загрузка':>8}")
+    for size in args.students:
+        students = make_roster(size)
+        for name, policy_class in POLICIES.items():
+            runs = [run_policy(policy_class, examiners, students, questions, seed) for seed in range(args.runs)]
+            assert all(run["examined"] == size for run in runs)
+            print(f"{size:>10} | {name:>15} | {mean(run['makespan'] for run in runs):>12.2f} сек | "
+                  f"{mean(run['exam_time'] for run in runs):>10.2f} сек | "
+                  f"{mean(run['utilisation'] for run in runs):>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Масштабирование многопроцессного режима run_sharded по числу ядер.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_sharding --students 200000 --examiners 64
+"""
+import argparse
+import os
+import time
+
+from s21_examing.sharding import run_sharded
+from benchmarks.synthetic import make_questions, make_roster
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=100000)
+    parser.add_argument("--examiners", type=int, default=64)
+    parser.add_argument("--questions", type=int, default=100)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    students = make_roster(args.students)
+    examiners = make_roster(args.examiners, seed=1)
+    questions = make_questions(args.questions)
+
+    shard_counts = sorted({1, *(2 ** power for power in range(args.max_shards.bit_length())), args.max_shards})
+    shard_counts = [count for count in shard_counts if count <= args.max_shards]
+
+    print(f"Студентов: {args.students}, экзаменаторов: {args.examiners}, ядер: {os.cpu_count()}")
+    print(f"{'частей':>7} | {'время':>9} | {'ускорение':>9} | {'экзаменов':>10} | {'время экзамена':>15}")
+    baseline = None
+    for shards in shard_counts:
+        started = time.perf_counter()
+        statistics = run_sharded(examiners, students, questions, shards=shards, seed=args.seed)
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"{shards:>7} | {elapsed:>7.2f} с | {baseline / elapsed:>8.2f}x | "
+              f"{statistics.total_students:>10} | {statistics.get_exam_time():>11.2f} сек")
+
+
+if __name__ == "__main__":
+    main()
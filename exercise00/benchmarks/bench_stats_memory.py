@@ -0,0 +1,71 @@
+"""
+Память, занимаемая статистикой студентов и экзаменаторов:
+прежние словари словарей против колоночного хранилища ExamStatistics.
+
+Запуск из каталога exercise00:
+    python -m benchmarks.bench_stats_memory --sizes 1000 100000 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from collections import deque
+
+from s21_examing import ExamStatistics, Person
+from benchmarks.synthetic import make_roster
+
+
+def build_legacy(students, examiners) -> tuple[dict, dict]:
+    """Прежняя схема: по словарю со строковыми ключами на каждого человека"""
+    students_stat_dict = {
+        student: {"student_status": ExamStatistics.STUDENT_STATUSES[0], "time_spent": 0.0}
+        for student in students
+    }
+    examiners_stat_dict = {
+        examiner: {"current_student": None, "total_students": 0, "failed_students": 0,
+                   "time_worked": 0.0, "on_lunch_break": False}
+        for examiner in examiners
+    }
+    # Как после экзамена: у каждого студента своё время
+    for index, stats in enumerate(students_stat_dict.values()):
+        stats["student_status"] = ExamStatistics.STUDENT_STATUSES[1 + index % 2]
+        stats["time_spent"] = index * 0.001
+    return students_stat_dict, examiners_stat_dict
+
+
+def build_columnar(students, examiners) -> ExamStatistics:
+    """Новая схема: ExamStatistics с колоночным хранилищем"""
+    statistics = ExamStatistics(students, examiners)
+    for index, student in enumerate(students):
+        statistics.update_student_stats(student, index % 2 == 0, index * 0.001)
+    return statistics
+
+
+def measure(builder, *args) -> int:
+    """Возвращает прирост памяти (в байтах), оставшийся после построения структуры"""
+    gc.collect()
+    tracemalloc.start()
+    result = builder(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--examiners", type=int, default=100)
+    args = parser.parse_args()
+
+    examiners = deque(Person(*record) for record in make_roster(args.examiners, seed=1))
+    print(f"{'студентов':>10} | {'словари':>12} | {'колонки':>12} | {'байт/студент':>14} | {'выигрыш':>8}")
+    for size in args.sizes:
+        students = deque(Person(*record) for record in make_roster(size))
+        legacy = measure(build_legacy, students, examiners)
+        columnar = measure(build_columnar, students, examiners)
+        print(f"{size:>10} | {legacy / 2 ** 20:>9.2f} МБ | {columnar / 2 ** 20:>9.2f} МБ | "
+              f"{legacy / size:>6.0f} → {columnar / size:<5.0f} | {legacy / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
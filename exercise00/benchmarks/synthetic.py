@@ -0,0 +1,37 @@
+"""Генерация синтетических списков студентов, экзаменаторов и банков вопросов для бенчмарков"""
+import random
+
+MEN_NAMES = ('Петр', 'Сергей', 'Иван', 'Алексей', 'Степан', 'Михаил')
+WOMEN_NAMES = ('Варвара', 'Екатерина', 'Александра', 'Дарья', 'Мария', 'Ольга')
+ALPHABET = 'абвгдежзиклмнопрстуфхцчшэюя'
+
+
+def unique_suffix(index: int) -> str:
+    """Возвращает уникальную буквенную приставку для номера записи"""
+    letters = []
+    while True:
+        index, rest = divmod(index, len(ALPHABET))
+        letters.append(ALPHABET[rest])
+        if not index:
+            return ''.join(reversed(letters))
+
+
+def make_roster(size: int, seed: int = 0) -> list:
+    """Возвращает список [first_name, last_name] из size уникальных людей"""
+    rng = random.Random(seed)
+    roster = []
+    for index in range(size):
+        names = MEN_NAMES if rng.random() < 0.5 else WOMEN_NAMES
+        # Окончание имени (и значит пол) сохраняется: приставка добавляется в начало
+        roster.append([f"{unique_suffix(index).capitalize()}-{rng.choice(names)}", rng.choice('МЖ')])
+    return roster
+
+
+def make_questions(size: int, min_words: int = 3, max_words: int = 8, seed: int = 0) -> list:
+    """Возвращает список из size уникальных вопросов"""
+    rng = random.Random(seed)
+    vocabulary = [unique_suffix(index) for index in range(2000)]
+    return [
+        ' '.join([f"вопрос{index}"] + rng.choices(vocabulary, k=rng.randint(min_words, max_words) - 1))
+        for index in range(size)
+    ]
@@ -0,0 +1 @@
+# Каталог exercise00 попадает в sys.path, поэтому тесты импортируют пакет s21_examing напрямую
@@ -1,22 +1,147 @@
+import argparse
 import asyncio
+import json
 from s21_examing import ExamManager
 from s21_examing import FileReader
+from s21_examing import VirtualClock
+from s21_examing import run_sharded
+from s21_examing.checkpoint import Checkpointer
+from s21_examing.compiled import compile_persons, compile_questions
+from s21_examing.events import EventLog
+from s21_examing.instrumentation import Instrumentation
+from s21_examing.replicas import run_replicas
+from s21_examing.scheduling import POLICIES
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Моделирование экзамена")
+    parser.add_argument("--simulated", action="store_true",
+                        help="моделировать экзамен в виртуальном времени (без реальных пауз)")
+    parser.add_argument("--pace", type=float, default=0.0,
+                        help="секунд реального времени на секунду модели в режиме --simulated")
+    parser.add_argument("--policy", choices=sorted(POLICIES),
+                        help="политика распределения студентов по экзаменаторам (по умолчанию fifo; "
+                             "при --resume восстанавливается из снимка)")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="разделить экзамен на N частей по процессам (виртуальное время, только итог; "
+                             "частей не больше, чем экзаменаторов)")
+    parser.add_argument("--headless", action="store_true",
+                        help="не рисовать таблицы; итог выводится в JSON (см. --summary)")
+    parser.add_argument("--events", metavar="PATH",
+                        help="писать события экзамена в JSONL-файл ('-' — в stdout)")
+    parser.add_argument("--summary", metavar="PATH", default="-",
+                        help="куда записать итог в JSON в режиме --headless ('-' — stdout; "
+                             "вместе с --events - итог выводится последним событием 'summary')")
+    parser.add_argument("--instrument", action="store_true",
+                        help="замерять ожидание в очереди, простой и обеды экзаменаторов, выдачу студентов")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="периодически сохранять снимок состояния экзамена в файл")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0,
+                        help="интервал между снимками в секундах реального времени")
+    parser.add_argument("--resume", metavar="PATH",
+                        help="продолжить экзамен из снимка, сохранённого через --checkpoint")
+    parser.add_argument("--replicas", type=int, default=0,
+                        help="провести N независимых повторов экзамена по процессам и вывести доверительные интервалы")
+    parser.add_argument("--seed", help="seed повторов (по умолчанию выбирается случайно и выводится в отчёте)")
+    parser.add_argument("--workers", type=int, default=0, help="число процессов для --replicas (по умолчанию — по числу ядер)")
+    parser.add_argument("--compile", action="store_true",
+                        help="скомпилировать файлы студентов, экзаменаторов и вопросов в двоичный формат (.bin) и выйти")
+    args = parser.parse_args()
+    if args.resume and args.policy is not None:
+        parser.error("--policy нельзя задать вместе с --resume: политика восстанавливается из снимка")
+    if args.resume and (args.shards or args.replicas):
+        parser.error("--resume нельзя совмещать с --shards и --replicas")
+    return args
+
+def compile_files():
+    """Компилирует входные файлы: при следующих запусках они загружаются без разбора текста"""
+    for filename in ('students.txt', 'examiners.txt'):
+        records = FileReader(filename).read_persons()
+        print(f"{filename} -> {compile_persons(filename, records)} ({len(records)} чел.)")
+    questions = FileReader('questions.txt', use_compiled=False).read_questions()
+    print(f"questions.txt -> {compile_questions('questions.txt', questions)} ({len(questions)} вопр.)")
+
+def get_summary(statistics, instrumentation=None) -> dict:
+    """Итог экзамена (и замеры, если они включены)"""
+    summary = statistics.get_summary_info()
+    if instrumentation is not None:
+        summary["instrumentation"] = instrumentation.to_dict()
+    return summary
+
+def write_summary(statistics, path, instrumentation=None):
+    """Записывает итог экзамена (и замеры, если они включены) в JSON"""
+    text = json.dumps(get_summary(statistics, instrumentation), ensure_ascii=False, indent=2)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w', encoding='UTF-8') as file:
+            file.write(text + '\n')
 
 def main():
+    args = parse_args()
     try:
-        students = FileReader('students.txt').read_persons()
-        examiners = FileReader('examiners.txt').read_persons()
-        questions = FileReader('questions.txt').read_questions()
-        test_exam = ExamManager(examiners, students, questions)
-        asyncio.run(main_async(test_exam))
+        if args.compile:
+            compile_files()
+            return
+        if not args.resume:
+            # При возобновлении студенты, экзаменаторы и вопросы берутся из снимка, файлы не читаются
+            students = FileReader('students.txt').load_persons()
+            examiners = FileReader('examiners.txt').load_persons()
+            questions = FileReader('questions.txt').read_questions()
+            if args.replicas:
+                report = run_replicas(examiners, students, questions, args.replicas, seed=args.seed,
+                                      workers=args.workers, policy=args.policy or "fifo")
+                if args.headless:
+                    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+                else:
+                    from s21_examing.presentation import console
+                    console.print(report.get_table())
+                return
+            if args.shards:
+                statistics = run_sharded(examiners, students, questions, shards=args.shards,
+                                         policy=args.policy or "fifo")
+                if args.headless:
+                    write_summary(statistics, args.summary)
+                else:
+                    from s21_examing.presentation import console
+                    console.print(statistics.get_layout())
+                return
+        clock = VirtualClock(pace=args.pace) if args.simulated else None
+        events = EventLog.open(args.events) if args.events else None
+        instrumentation = Instrumentation() if args.instrument else None
+        checkpoint = Checkpointer(args.checkpoint, args.checkpoint_interval) if args.checkpoint else None
+        if args.resume:
+            test_exam = ExamManager.from_checkpoint(args.resume, clock=clock, events=events,
+                                                    instrumentation=instrumentation, checkpoint=checkpoint)
+        else:
+            test_exam = ExamManager(examiners, students, questions, clock=clock,
+                                    policy=POLICIES[args.policy or "fifo"](),
+                                    events=events, instrumentation=instrumentation, checkpoint=checkpoint)
+        # stdout уже занят потоком событий JSONL: итог пишется в него последним событием 'summary'
+        summary_event = args.headless and args.summary == '-' and args.events == '-'
+        try:
+            asyncio.run(main_async(test_exam, render=not args.headless))
+            if summary_event:
+                events.emit("summary", test_exam.statistics.get_exam_time(),
+                            **get_summary(test_exam.statistics, instrumentation))
+        finally:
+            if events is not None:
+                events.close()
+        if args.headless:
+            if not summary_event:
+                write_summary(test_exam.statistics, args.summary, instrumentation)
+        elif instrumentation is not None:
+            from s21_examing.presentation import console
+            console.print(instrumentation.get_histograms_table())
+            console.print(instrumentation.get_examiners_table())
     except Exception as e:
         print(f"[ERROR] Ошибка во входных данных: {e}")
 
-async def main_async(manager):
+async def main_async(manager, render=True):
     try:
-        exam_task = asyncio.create_task(manager.run_exam())
-        stats_task = asyncio.create_task(manager.statistics.update_both_tables())
-        await asyncio.gather(exam_task, stats_task)
+        tasks = [asyncio.create_task(manager.run_exam())]
+        if render:
+            tasks.append(asyncio.create_task(manager.statistics.update_both_tables()))
+        await asyncio.gather(*tasks)
     except Exception as e:
         print(f"[ERROR] Ошибка в ходе экзамена: {e}")
 
@@ -1,7 +1,37 @@
+from importlib import import_module
+
 from .person import Person
 from .exam_manager import ExamManager
 from .exam import Exam
 from .exam_statistics import ExamStatistics
 from .filereader import FileReader
+from .question_bank import QuestionBank
+from .clock import RealClock, VirtualClock
+from .sharding import run_sharded
+from .replicas import run_replicas
+from .checkpoint import Checkpointer
+from .events import EventLog
+from .instrumentation import Instrumentation
+from .scheduling import SchedulingPolicy, EarliestFinishPolicy
+
+# Модули со сторонними зависимостями загружаются при первом обращении:
+# ядро моделирования импортирует только стандартную библиотеку (rich — только в presentation)
+_LAZY_ATTRIBUTES = {
+    'check_answers_batch': '.exam_batch',  # numpy
+}
+
+__all__ = ['Person', 'ExamManager', 'ExamStatistics', 'FileReader', 'Exam', 'QuestionBank', 'RealClock', 'VirtualClock',
+           'check_answers_batch', 'run_sharded', 'run_replicas', 'EventLog', 'Instrumentation', 'Checkpointer',
+           'SchedulingPolicy', 'EarliestFinishPolicy']
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['Person', 'ExamManager', 'ExamStatistics', 'FileReader', 'Exam']
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import pickle
+import time
+import zlib
+
+CHECKPOINT_MAGIC = b'S21CKPT'
+CHECKPOINT_VERSION = 3
+
+
+def write_checkpoint(path: str, data: bytes) -> None:
+    """
+    Сжимает и атомарно записывает снимок: сначала во временный файл, затем замена,
+    поэтому при падении процесса на диске остаётся предыдущий целый снимок
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(CHECKPOINT_MAGIC + bytes([CHECKPOINT_VERSION]))
+        file.write(zlib.compress(data, 1))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def dump_checkpoint(path: str, state: dict) -> None:
+    """Сериализует состояние экзамена и записывает снимок"""
+    write_checkpoint(path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def read_checkpoint(path: str) -> dict:
+    """Читает снимок состояния экзамена или выбрасывает исключение, если файл не является снимком"""
+    try:
+        with open(path, 'rb') as file:
+            header = file.read(len(CHECKPOINT_MAGIC) + 1)
+            if header[:-1] != CHECKPOINT_MAGIC or header[-1:] != bytes([CHECKPOINT_VERSION]):
+                raise ValueError(f"Файл '{path}' не является контрольной точкой экзамена (версии {CHECKPOINT_VERSION})")
+            return pickle.loads(zlib.decompress(file.read()))
+    except FileNotFoundError:
+        print(f"Файл '{path}' не найден.")
+        raise
+    except Exception as e:
+        print(f"[ERROR] Ошибка чтения контрольной точки: {e}")
+        raise
+
+
+class Checkpointer:
+    """
+    Периодические снимки состояния экзамена не чаще раза в interval секунд реального времени
+    (при любых часах экзамена): столько работы можно потерять при падении процесса.
+    В цикле событий снимается только копия состояния (между await оно согласовано),
+    а сериализация, сжатие и запись на диск выполняются в отдельном потоке.
+    Пока предыдущий снимок пишется, новые не делаются
+    """
+
+    def __init__(self, path: str, interval: float = 30.0) -> None:
+        self.path = path
+        self.interval = interval
+        self.next_at = None
+        self.saved = 0
+        self._writing = None
+
+    def due(self) -> bool:
+        """Пора ли делать снимок"""
+        now = time.monotonic()
+        if self.next_at is None:
+            self.next_at = now + self.interval
+        if self._writing is not None:
+            if not self._writing.done():
+                return False
+            self._writing.result()  # ошибка записи предыдущего снимка не теряется
+        return now >= self.next_at
+
+    def save(self, state: dict) -> None:
+        """
+        Запускает сериализацию и запись снимка в фоне.
+        state — копия, которую экзамен больше не меняет (ExamManager.get_state)
+        """
+        self.next_at = time.monotonic() + self.interval
+        self.saved += 1
+        self._writing = asyncio.ensure_future(asyncio.to_thread(dump_checkpoint, self.path, state))
+
+    async def wait(self) -> None:
+        """Дожидается окончания записи последнего снимка"""
+        if self._writing is not None:
+            await self._writing
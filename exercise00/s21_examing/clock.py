@@ -0,0 +1,108 @@
+import asyncio
+import heapq
+import itertools
+
+
+class RealClock:
+    """Часы реального времени: паузы выполняются через asyncio.sleep"""
+
+    def __init__(self, pace: float = 1.0) -> None:
+        self.pace = pace
+        self._start = None
+        self._offset = 0.0
+
+    def now(self) -> float:
+        """Возвращает время (в секундах модели) с момента начала экзамена"""
+        loop = asyncio.get_running_loop()
+        if self._start is None:
+            self._start = loop.time()
+        return self._offset + ((loop.time() - self._start) / self.pace if self.pace else 0.0)
+
+    def restore(self, now: float) -> None:
+        """Продолжает отсчёт с момента now (при возобновлении экзамена)"""
+        self._offset = now
+
+    async def sleep(self, delay: float) -> None:
+        """Приостанавливает процесс на delay секунд модели"""
+        await asyncio.sleep(delay * self.pace)
+
+    async def sleep_until(self, moment: float) -> None:
+        """Приостанавливает процесс до момента moment модельного времени"""
+        await self.sleep(max(moment - self.now(), 0.0))
+
+    async def gather(self, *coros) -> list:
+        """Запускает процессы экзамена и дожидается их завершения"""
+        self.now()
+        return await asyncio.gather(*coros)
+
+
+class VirtualClock:
+    """
+    Часы модельного времени (дискретно-событийный планировщик).
+    Паузы процессов складываются в очередь с приоритетом по моменту пробуждения.
+    Как только все процессы ждут, время сдвигается к ближайшему событию,
+    поэтому экзамен любой длины моделируется за миллисекунды.
+    При pace > 0 каждый сдвиг дополнительно выдерживается в реальном времени
+    (pace секунд на секунду модели) — для живого отображения.
+    """
+
+    def __init__(self, pace: float = 0.0) -> None:
+        self.pace = pace
+        self._now = 0.0
+        self._events = []
+        self._counter = itertools.count()
+        self._active = 0
+        self._advancing = False
+
+    def now(self) -> float:
+        """Возвращает текущее модельное время"""
+        return self._now
+
+    def restore(self, now: float) -> None:
+        """Продолжает отсчёт с момента now (при возобновлении экзамена)"""
+        self._now = now
+
+    async def sleep(self, delay: float) -> None:
+        """Регистрирует событие пробуждения и ждёт, пока до него дойдёт очередь"""
+        await self.sleep_until(self._now + max(delay, 0.0))
+
+    async def sleep_until(self, moment: float) -> None:
+        """Ждёт момента moment модельного времени (точно, без пересчёта через задержку)"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._events, (max(moment, self._now), next(self._counter), future))
+        self._schedule_advance()
+        await future
+
+    async def gather(self, *coros) -> list:
+        """Запускает процессы экзамена под управлением модельных часов"""
+        self._active += len(coros)
+        return await asyncio.gather(*(self._track(coro) for coro in coros))
+
+    async def _track(self, coro):
+        """Учитывает процесс как активный до его завершения"""
+        try:
+            return await coro
+        finally:
+            self._active -= 1
+            self._schedule_advance()
+
+    def _schedule_advance(self) -> None:
+        """Сдвигает время, если все активные процессы ожидают события"""
+        if self._advancing or not self._events or len(self._events) < self._active:
+            return
+        self._advancing = True
+        asyncio.get_running_loop().create_task(self._advance())
+
+    async def _advance(self) -> None:
+        """Будит все процессы, назначенные на ближайший момент времени"""
+        try:
+            wake_time = self._events[0][0]
+            if self.pace:
+                await asyncio.sleep((wake_time - self._now) * self.pace)
+            self._now = wake_time
+            while self._events and self._events[0][0] == wake_time:
+                _, _, future = heapq.heappop(self._events)
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            self._advancing = False
@@ -0,0 +1,211 @@
+"""
+Скомпилированный двоичный формат списков людей и банков вопросов.
+
+Файл (рядом с исходным, с суффиксом .bin) содержит заголовок с размером и временем
+изменения исходного файла, таблицу смещений строк, массивы индексов и блок строк UTF-8.
+Каждая строка (имя, фамилия, слово) хранится один раз. Люди уже проверены и хранят
+признак пола, вопросы уже разбиты на слова (текст вопроса хранится, только если
+он не совпадает со словами через пробел). Таблицы читаются через mmap срезами
+memoryview без копирования, блок строк декодируется одним вызовом.
+Компиляция файлов экзамена: python main.py --compile
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .person import Person
+from .question_bank import QuestionBank
+
+COMPILED_SUFFIX = '.bin'
+COMPILED_MAGIC = b'S21BIN'
+COMPILED_VERSION = 1
+KIND_PERSONS = 0
+KIND_QUESTIONS = 1
+JOINED_TEXT = 0xFFFFFFFF  # текст вопроса — его слова через пробел
+# magic, версия, вид, порядок байт (1 — little endian), mtime_ns и размер исходного файла,
+# число записей, число строк, длина дополнительной таблицы (слова вопросов)
+HEADER = struct.Struct('<6sBBB7xqqIII4x')
+
+
+def compiled_path(source: str) -> str:
+    """Возвращает путь к скомпилированному файлу для исходного текстового файла"""
+    return source + COMPILED_SUFFIX
+
+
+class StringTable:
+    """Таблица уникальных строк: каждой строке — свой номер"""
+
+    def __init__(self) -> None:
+        self.index = {}
+
+    def add(self, string: str) -> int:
+        return self.index.setdefault(string, len(self.index))
+
+    def to_bytes(self) -> tuple[array, bytes]:
+        """
+        Возвращает таблицу смещений в символах (на одно больше, чем строк) и блок строк UTF-8:
+        при загрузке блок декодируется целиком, а строки берутся срезами
+        """
+        offsets = array('I', [0])
+        position = 0
+        for string in self.index:
+            position += len(string)
+            offsets.append(position)
+        return offsets, ''.join(self.index).encode('UTF-8')
+
+
+def padded(data: bytes) -> bytes:
+    """Дополняет блок нулями до границы 4 байт, чтобы следующие таблицы были выровнены"""
+    return data + bytes(-len(data) % 4)
+
+
+def write_compiled(target: str, source: str, kind: int, count: int, strings: StringTable,
+                   tables: list, extra_count: int = 0) -> None:
+    """Атомарно записывает заголовок, таблицы и блок строк"""
+    source_stat = os.stat(source)
+    offsets, blob = strings.to_bytes()
+    header = HEADER.pack(COMPILED_MAGIC, COMPILED_VERSION, kind, sys.byteorder == 'little',
+                         source_stat.st_mtime_ns, source_stat.st_size, count, len(strings.index), extra_count)
+    temp_path = f"{target}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(header)
+        file.write(offsets.tobytes())
+        for table in tables:
+            file.write(padded(table.tobytes()))
+        file.write(blob)
+    os.replace(temp_path, target)
+
+
+def compile_persons(source: str, records, target: str | None = None) -> str:
+    """
+    Проверяет записи [first_name, last_name], записывает людей в двоичный файл
+    и возвращает его путь. Если есть неверные записи, сообщает обо всех и выбрасывает исключение
+    """
+    persons = Person.build_all(records)
+    target = target or compiled_path(source)
+    strings = StringTable()
+    first_names, last_names, women = array('I'), array('I'), array('B')
+    for person in persons:
+        first_names.append(strings.add(person.first_name))
+        last_names.append(strings.add(person.last_name))
+        women.append(person.sex == 'women')
+    write_compiled(target, source, KIND_PERSONS, len(women), strings, [first_names, last_names, women])
+    return target
+
+
+def compile_questions(source: str, questions: QuestionBank, target: str | None = None) -> str:
+    """Записывает банк вопросов (вместе с разбиением на слова) в двоичный файл и возвращает его путь"""
+    target = target or compiled_path(source)
+    strings = StringTable()
+    texts, token_offsets, tokens = array('I'), array('I', [0]), array('I')
+    for question in questions:
+        words = questions.tokens(question)
+        texts.append(JOINED_TEXT if ' '.join(words) == question else strings.add(question))
+        tokens.extend(strings.add(word) for word in words)
+        token_offsets.append(len(tokens))
+    write_compiled(target, source, KIND_QUESTIONS, len(texts), strings, [texts, token_offsets, tokens],
+                   extra_count=len(tokens))
+    return target
+
+
+class CompiledFile:
+    """Отображённый в память скомпилированный файл"""
+
+    def __init__(self, path: str, kind: int) -> None:
+        self.path = path
+        self.offsets = None
+        with open(path, 'rb') as file:
+            self.mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mapped)
+        (magic, version, file_kind, little_endian, self.source_mtime_ns, self.source_size,
+         self.count, self.strings_count, self.extra_count) = HEADER.unpack_from(self.view)
+        if magic != COMPILED_MAGIC or version != COMPILED_VERSION or file_kind != kind:
+            self.close()
+            raise ValueError(f"Файл '{path}' не является скомпилированным файлом нужного вида")
+        self.native = bool(little_endian) == (sys.byteorder == 'little')
+        self.position = HEADER.size
+        self.offsets = self.table(self.strings_count + 1)
+
+    def is_fresh(self, source: str) -> bool:
+        """Соответствует ли файл текущему исходному файлу (и порядку байт этой машины)"""
+        try:
+            source_stat = os.stat(source)
+        except FileNotFoundError:
+            return self.native  # исходного файла нет — используем скомпилированный
+        return self.native and (source_stat.st_mtime_ns, source_stat.st_size) == \
+            (self.source_mtime_ns, self.source_size)
+
+    def table(self, length: int, fmt: str = 'I') -> memoryview:
+        """Возвращает следующую таблицу файла как срез memoryview (без копирования)"""
+        size = length * struct.calcsize(fmt)
+        start = self.position
+        self.position += size + (-size % 4)
+        return self.view[start:start + size].cast(fmt)
+
+    def strings(self, intern=False) -> list[str]:
+        """
+        Декодирует блок строк и режет его на строки по таблице смещений.
+        Блок строк идёт после всех таблиц, поэтому вызывается после чтения таблиц
+        """
+        blob = self.view[self.position:]
+        text = str(blob, 'UTF-8')
+        blob.release()
+        offsets = self.offsets.tolist()
+        strings = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+        return list(map(sys.intern, strings)) if intern else strings
+
+    def close(self) -> None:
+        if self.offsets is not None:
+            self.offsets.release()
+        self.view.release()
+        self.mapped.close()
+
+
+def load_persons(path: str, source: str | None = None) -> list[Person] | None:
+    """
+    Загружает людей из скомпилированного файла без повторной проверки.
+    Возвращает None, если файл устарел относительно исходного файла source
+    """
+    compiled = CompiledFile(path, KIND_PERSONS)
+    try:
+        if source is not None and not compiled.is_fresh(source):
+            return None
+        first_names, last_names = compiled.table(compiled.count), compiled.table(compiled.count)
+        women = compiled.table(compiled.count, 'B')
+        strings = compiled.strings()
+        make = Person.assembler()
+        persons = [make(strings[first], strings[last], 'women' if woman else 'men')
+                   for first, last, woman in zip(first_names, last_names, women)]
+        first_names.release(), last_names.release(), women.release()
+        return persons
+    finally:
+        compiled.close()
+
+
+def load_questions(path: str, source: str | None = None) -> QuestionBank | None:
+    """
+    Загружает банк вопросов из скомпилированного файла без повторного разбиения на слова.
+    Возвращает None, если файл устарел относительно исходного файла source
+    """
+    compiled = CompiledFile(path, KIND_QUESTIONS)
+    try:
+        if source is not None and not compiled.is_fresh(source):
+            return None
+        texts = compiled.table(compiled.count)
+        token_offsets = compiled.table(compiled.count + 1)
+        tokens = compiled.table(compiled.extra_count)
+        strings = compiled.strings(intern=True)
+        # Слова всех вопросов подряд, вопрос — срез этого списка
+        words = [strings[word] for word in tokens]
+        bounds = token_offsets.tolist()
+        bank = QuestionBank()
+        for text, start, end in zip(texts, bounds, bounds[1:]):
+            question_words = tuple(words[start:end])
+            bank.add(' '.join(question_words) if text == JOINED_TEXT else strings[text], question_words)
+        texts.release(), token_offsets.release(), tokens.release()
+        return bank
+    finally:
+        compiled.close()
+
@@ -0,0 +1,39 @@
+from collections import deque
+
+from .person import Person
+from .scheduling import SchedulingPolicy
+
+
+class Dispatcher:
+    """
+    Раздаёт студентов экзаменаторам из собственной очереди (deque) вместо общей блокировки.
+    Очередь заполняется один раз, экзаменаторы забирают студентов без ожидания.
+    Политика распределения решает, может ли экзаменатор взять ещё одного студента
+    """
+
+    def __init__(self, students=(), policy: SchedulingPolicy | None = None) -> None:
+        self.pending = deque(students)
+        self.policy = policy if policy is not None else SchedulingPolicy()
+
+    def plan(self, examiners) -> None:
+        """Передаёт политике список экзаменаторов и размер очереди перед началом экзамена"""
+        self.policy.plan(list(examiners), len(self.pending))
+
+    def get_student(self, examiner: Person | None = None, forecast=None) -> Person | None:
+        """
+        Возвращает следующего студента или None, если очередь пуста или политика отказала.
+        forecast передаётся политике (см. SchedulingPolicy.take)
+        """
+        if not self.pending or (examiner is not None and not self.policy.take(examiner, forecast)):
+            return None
+        return self.pending.popleft()
+
+    def snapshot(self) -> list:
+        """Возвращает список ожидающих студентов, не меняя очередь"""
+        return list(self.pending)
+
+    def __iter__(self):
+        return iter(self.pending)
+
+    def __len__(self) -> int:
+        return len(self.pending)
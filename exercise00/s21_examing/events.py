@@ -0,0 +1,49 @@
+import json
+import sys
+
+
+class EventLog:
+    """
+    Буферизованный поток событий экзамена в формате JSONL (одно событие — одна строка).
+    События копятся в буфере и записываются пачками по buffer_size строк
+    """
+
+    def __init__(self, stream, buffer_size=1000, close_stream=False) -> None:
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.close_stream = close_stream
+        self._buffer = []
+
+    @classmethod
+    def open(cls, path: str, buffer_size=1000) -> 'EventLog':
+        """Открывает поток событий в файл (или в stdout, если путь '-')"""
+        if path == '-':
+            return cls(sys.stdout, buffer_size)
+        return cls(open(path, 'w', encoding='UTF-8'), buffer_size, close_stream=True)
+
+    def emit(self, event: str, time: float, **fields) -> None:
+        """Добавляет событие в буфер"""
+        record = {"event": event, "time": round(time, 3)}
+        record.update(fields)
+        self._buffer.append(json.dumps(record, ensure_ascii=False))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Записывает накопленные события в поток"""
+        if self._buffer:
+            self.stream.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Сбрасывает буфер и закрывает файл"""
+        self.flush()
+        if self.close_stream:
+            self.stream.close()
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,67 +1,59 @@
 import random
+from bisect import bisect
+
 from .person import Person
+from .question_bank import cumulative_weights, golden_weights
+from .sampling import WordSampler
 
 class Exam:
-    def __init__(self, examiner: Person, student: Person, question: str) -> None:
+    def __init__(self, examiner: Person, student: Person, question: str | tuple, rng=random) -> None:
         self.examiner = examiner
         self.student = student
-        self.question = question.split()
+        self.question = question.split() if isinstance(question, str) else list(question)
+        self.reversed = False
+        # Источник случайных чисел: модуль random или отдельный random.Random (например, у экзаменатора)
+        self.rng = rng
 
-    def random_answer_from_list(self) -> str | None:
+    def random_answer_from_list(self, reverse=False) -> str | None:
         """Возвращает случайное слово(ответ) из вопроса"""
-        f_const = 1.618
         if self.question:
-            weights = self.calculate_weights(f_const)
-
-            return random.choices(self.question, weights=weights, k=1)[0]
+            n = len(self.question)
+            cum_weights = cumulative_weights(n, reverse)
+            return self.question[bisect(cum_weights, self.rng.random() * cum_weights[-1], 0, n - 1)]
         return None
 
     def calculate_weights(self, f_const):
         """Возвращает список веса (вероятности выбора) слова в вопросе"""
-        if not self.question:
-            return []
-
-        n = len(self.question)
-        weights = []
-        total = 0.0
-
-        for i in range(n):
-            if i == 0:
-                weight = 1 / f_const
-            elif i == n - 1:
-                weight = 1 - total
-            else:
-                weight = (1 - total) / f_const
-
-            weights.append(weight)
-            total += weight
-
-        return weights
+        return golden_weights(len(self.question), f_const)
 
     def get_student_answer(self) -> str | None:
         """Возвращает ответ студента в зависимости от пола"""
         if self.question:
-            if self.student.sex == 'women':
-                self.question = self.question[::-1]
-
-            return self.random_answer_from_list()
+            # Вместо разворота списка используем развёрнутую таблицу весов
+            self.reversed = self.student.sex == 'women'
+            return self.random_answer_from_list(self.reversed)
         return None
 
     def get_examiner_answer(self) -> list | None:
         """Возвращает список ответов (минимум 1 ответ) экзаменатора в зависимости от пола"""
         if self.question:
             if self.examiner.sex == 'women':
-                self.question = self.question[::-1]
+                self.reversed = not self.reversed
+            # Для удаления первого вхождения слова нужен фактический порядок
+            if self.reversed:
+                self.question.reverse()
+                self.reversed = False
 
-        examiner_answer = [(self.random_answer_from_list())]
+        sampler = WordSampler(self.question, self.rng)
+        examiner_answer = [sampler.draw()]
 
         if examiner_answer:
-            while self.question:
-                if random.random() < 2 / 3:
+            while sampler:
+                if self.rng.random() < 2 / 3:
                     break
-                self.question.remove(examiner_answer[-1])
-                if self.question:
-                    examiner_answer.append(self.random_answer_from_list())
+                sampler.remove(examiner_answer[-1])
+                if sampler:
+                    examiner_answer.append(sampler.draw())
             return examiner_answer
         return None
 
@@ -0,0 +1,131 @@
+import numpy as np
+
+from .person import Person
+from .question_bank import F_CONST, golden_weights
+
+STOP_PROBABILITY = 2 / 3
+
+
+def golden_cum_weights(length: int, f_const: float = F_CONST) -> np.ndarray:
+    """Возвращает накопленные веса золотого сечения для вопроса из length слов"""
+    weights = golden_weights(length, f_const)
+    return np.cumsum(np.asarray(weights, dtype=np.float64))
+
+
+def draw_ranks(cum_weights: np.ndarray, lengths: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Разыгрывает номер слова в списке из lengths слов.
+    Веса первых слов списка не зависят от его длины, поэтому достаточно
+    одной таблицы на максимальную длину: хвост сливается в последнее слово.
+    """
+    ranks = np.searchsorted(cum_weights, rng.random(lengths.shape[0]), side='right')
+    return np.minimum(ranks, lengths - 1)
+
+
+def nth_alive(alive: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Возвращает позицию ranks-го (с нуля) ещё не выбранного слова в каждой строке"""
+    order = np.cumsum(alive, axis=1)
+    return np.argmax(alive & (order == (ranks + 1)[:, None]), axis=1)
+
+
+def tokenize(questions) -> tuple[np.ndarray, np.ndarray]:
+    """Переводит вопросы в матрицу номеров слов (с -1 в хвосте) и массив длин"""
+    vocabulary = {}
+    unique_rows = {}
+    rows = []
+    inverse = []
+    for question in questions:
+        key = question if isinstance(question, str) else tuple(question)
+        row = unique_rows.get(key)
+        if row is None:
+            words = question.split() if isinstance(question, str) else question
+            row = unique_rows[key] = len(rows)
+            rows.append([vocabulary.setdefault(word, len(vocabulary)) for word in words])
+        inverse.append(row)
+
+    unique_lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    if unique_lengths.size and unique_lengths.min() == 0:
+        raise ValueError("Вопрос не может быть пустым")
+
+    unique_ids = np.full((len(rows), int(unique_lengths.max(initial=0))), -1, dtype=np.int64)
+    for i, row in enumerate(rows):
+        unique_ids[i, :len(row)] = row
+
+    inverse = np.asarray(inverse, dtype=np.int64)
+    return unique_ids[inverse], unique_lengths[inverse]
+
+
+def orient(ids: np.ndarray, lengths: np.ndarray, reverse: np.ndarray) -> np.ndarray:
+    """Разворачивает строки матрицы слов там, где reverse == True"""
+    positions = np.arange(ids.shape[1])
+    reversed_positions = np.where(positions < lengths[:, None], lengths[:, None] - 1 - positions, positions)
+    columns = np.where(reverse[:, None], reversed_positions, positions)
+    return np.take_along_axis(ids, columns, axis=1)
+
+
+def women_mask(persons) -> np.ndarray:
+    """Возвращает булев массив: True, если человек — женщина"""
+    if isinstance(persons, np.ndarray) and persons.dtype == np.bool_:
+        return persons
+    # Одни и те же люди повторяются в тройках много раз — пол считаем один раз на объект
+    cache = {}
+
+    def is_woman(person) -> bool:
+        key = id(person)
+        if key not in cache:
+            cache[key] = (person.sex if isinstance(person, Person) else person) == 'women'
+        return cache[key]
+
+    return np.fromiter(map(is_woman, persons), dtype=np.bool_)
+
+
+def check_answers_batch(examiners, students, questions, rng=None) -> np.ndarray:
+    """
+    Пакетный аналог Exam.check_answer для массивов троек (экзаменатор, студент, вопрос).
+    Экзаменаторы и студенты — объекты Person (или булевы маски «женщина»),
+    вопросы — строки или списки слов. Возвращает булев массив результатов.
+    Сохраняет семантику Exam: веса золотого сечения, разворот списка по полу
+    (разворот экзаменатора применяется поверх разворота студента),
+    остановка экзаменатора с вероятностью 2/3 и удаление выбранного слова.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    examiner_women = women_mask(examiners)
+    student_women = women_mask(students)
+    ids, lengths = tokenize(questions)
+
+    size = lengths.shape[0]
+    if not (examiner_women.shape[0] == student_women.shape[0] == size):
+        raise ValueError("Массивы экзаменаторов, студентов и вопросов должны быть одной длины")
+    if not size:
+        return np.zeros(0, dtype=np.bool_)
+
+    cum_weights = golden_cum_weights(ids.shape[1])
+
+    # Ответ студента
+    student_ids = orient(ids, lengths, student_women)
+    student_ranks = draw_ranks(cum_weights, lengths, rng)
+    student_words = student_ids[np.arange(size), student_ranks]
+
+    # Ответы экзаменатора: выбор без возвращения, пока он не остановится
+    examiner_ids = orient(ids, lengths, student_women ^ examiner_women)
+    alive = np.arange(ids.shape[1]) < lengths[:, None]
+    remaining = lengths.copy()
+    passed = np.zeros(size, dtype=np.bool_)
+    rows = np.arange(size)
+
+    while rows.size:
+        row_alive = alive[rows]
+        ranks = draw_ranks(cum_weights, remaining[rows], rng)
+        words = examiner_ids[rows, nth_alive(row_alive, ranks)]
+        passed[rows] |= words == student_words[rows]
+
+        keep_going = rng.random(rows.size) >= STOP_PROBABILITY
+        rows, words, row_alive = rows[keep_going], words[keep_going], row_alive[keep_going]
+
+        # Удаляется первое вхождение выбранного слова, как в list.remove
+        removed = np.argmax(row_alive & (examiner_ids[rows] == words[:, None]), axis=1)
+        alive[rows, removed] = False
+        remaining[rows] -= 1
+        rows = rows[remaining[rows] > 0]
+
+    return passed
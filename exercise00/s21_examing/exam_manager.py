@@ -1,31 +1,102 @@
-import asyncio
+import copy
+import functools
 import random
 from collections import deque
 
+from .checkpoint import read_checkpoint
+from .clock import RealClock
+from .dispatcher import Dispatcher
 from .exam import Exam
 from .exam_statistics import ExamStatistics
 from .person import Person
+from .question_bank import QuestionBank
+from .scheduling import expected_exam_time
 
 class ExamManager:
-    def __init__(self, examiners: list, students: list, questions: list) -> None:
+    def __init__(self, examiners: list, students: list, questions: list, clock=None, policy=None,
+                 events=None, instrumentation=None, checkpoint=None, seed=None) -> None:
         self.__examiners = self.make_queue(examiners)
         self.__students = self.make_queue(students)
-        self.__questions = questions
-        self.lock = asyncio.Lock()
+        self.__questions = questions if isinstance(questions, QuestionBank) else QuestionBank(questions)
+        self.clock = clock if clock is not None else RealClock()
+        self.events = events
+        self.instrumentation = instrumentation
+        self.checkpoint = checkpoint
+        # Состояние экзаменаторов, нужное для возобновления: кто уже обедал
+        # и что делает экзаменатор сейчас ('lunch', начало, конец) или ('exam', студент, итог, длительность, начало, конец).
+        # Ключ — номер экзаменатора в очереди, а не Person: в списке могут быть тёзки
+        self.lunched = set()
+        self.in_progress = {}
+        # Без seed все случайные величины берутся из модуля random.
+        # С seed у каждого экзаменатора свой генератор: результат не зависит от порядка работы корутин
+        self.rngs = {}
+        if seed is not None:
+            self.seed_examiners(seed)
         self.statistics = ExamStatistics(self.__students, self.__examiners)
+        # Студенты переходят из списка в очередь диспетчера, статистика следит за её длиной
+        self.dispatcher = Dispatcher(self.__students, policy)
+        self.dispatcher.plan(self.__examiners)
+        self.__students.clear()
+        self.statistics.students_queue = self.dispatcher
+
+    @classmethod
+    def from_checkpoint(cls, path: str, clock=None, events=None, instrumentation=None,
+                        checkpoint=None) -> 'ExamManager':
+        """
+        Восстанавливает экзамен из снимка: очередь, статистику, политику, обеды,
+        начатые экзамены, время часов и состояние генератора случайных чисел
+        """
+        state = read_checkpoint(path)
+        manager = cls((), (), state['questions'], clock=clock, events=events,
+                      instrumentation=instrumentation, checkpoint=checkpoint)
+        manager.clock.restore(state['time'])
+        manager.__examiners = deque(state['examiners'])
+        # Политика уже разложила студентов — план не пересчитывается
+        manager.dispatcher = Dispatcher(state['students'], state['policy'])
+        manager.statistics = state['statistics']
+        manager.statistics.students_queue = manager.dispatcher
+        manager.statistics.examiners_queue = manager.__examiners
+        manager.lunched = state['lunched']
+        manager.in_progress = state['in_progress']
+        manager.rngs = state['rngs']
+        random.setstate(state['random'])
+        return manager
+
+    def get_state(self) -> dict:
+        """
+        Возвращает копию состояния экзамена для снимка (согласована между await).
+        Дальнейший ход экзамена копию не меняет, поэтому её можно сериализовать в отдельном потоке
+        """
+        return {
+            'time': self.clock.now(),
+            'random': random.getstate(),
+            'examiners': list(self.__examiners),
+            'students': self.dispatcher.snapshot(),
+            'policy': copy.deepcopy(self.dispatcher.policy),
+            'questions': self.__questions,
+            'statistics': self.statistics.snapshot(),
+            'lunched': set(self.lunched),
+            'in_progress': dict(self.in_progress),
+            'rngs': {number: copy.copy(rng) for number, rng in self.rngs.items()},
+        }
+
+    def seed_examiners(self, seed) -> None:
+        """Создаёт независимый генератор для каждого экзаменатора (из seed и номера экзаменатора)"""
+        self.rngs = {number: random.Random(f"{seed}/{number}") for number in range(len(self.__examiners))}
+
+    def rng_for(self, number: int):
+        """Возвращает генератор случайных чисел экзаменатора с номером number"""
+        return self.rngs.get(number, random)
 
     @staticmethod
     def make_queue(person_list: list) -> deque:
-        """Создаёт очередь из списка [first_name, last_name]"""
-        queue = deque()
-        for first, last in person_list:
-            try:
-                person = Person(first, last)
-                queue.append(person)
-            except ValueError as e:
-                print(f"[ERROR] Ошибка создания Person: {e}")
-                raise
-        return queue
+        """
+        Создаёт очередь из списка (или потока) записей [first_name, last_name]
+        или из списка уже созданных людей (например, FileReader.load_persons)
+        """
+        if isinstance(person_list, (list, tuple, deque)) and all(isinstance(p, Person) for p in person_list):
+            return deque(person_list)
+        return deque(Person.build_all(person_list))
 
     def get_examiner(self) -> Person | None:
         """Возвращает первый объект класса Person из очереди"""
@@ -33,17 +104,38 @@ class ExamManager:
             return self.__examiners.popleft()
         return None
 
-    def get_student(self) -> Person | None:
-        """Возвращает последний объект класса Person из очереди"""
-        if self.__students:
-            return self.__students.popleft()
-        return None
+    def get_student(self, examiner: Person | None = None, number: int | None = None) -> Person | None:
+        """Возвращает первый объект класса Person из очереди диспетчера"""
+        forecast = functools.partial(self.forecast, number) if number is not None else None
+        if self.instrumentation is None:
+            return self.dispatcher.get_student(examiner, forecast)
+        started = self.instrumentation.timer()
+        student = self.dispatcher.get_student(examiner, forecast)
+        self.instrumentation.dispatch(self.instrumentation.timer() - started)
+        return student
+
+    def forecast(self, number: int) -> tuple[float, int, list[tuple]]:
+        """
+        Фактическое состояние экзамена для политики распределения: текущий момент, число
+        ожидающих студентов и для каждого другого работающего экзаменатора — момент освобождения,
+        время работы после текущего экзамена, был ли обед и ожидаемая длительность экзамена
+        """
+        others = []
+        for other, (activity, *details) in self.in_progress.items():
+            if other == number:
+                continue
+            examiner = self.seats[other]
+            worked = self.statistics.get_examiner_work_time(examiner)
+            if activity == 'exam':
+                worked += details[2]
+            others.append((details[-1], worked, other in self.lunched, expected_exam_time(examiner)))
+        return self.clock.now(), len(self.dispatcher), others
 
     def get_question_list(self, number=3) -> str | None:
         """Возвращает несколько(по умолчанию 3) вопросов из списка вопросов"""
         try:
             if self.__questions and len(self.__questions) >= 3:
-                return random.sample(self.__questions, number)
+                return self.__questions.sample(number)
             else:
                 raise ValueError("Недостаточно вопросов для формирования списка")
         except ValueError:
@@ -56,48 +148,75 @@ class ExamManager:
     async def run_exam(self):
         """Запускает процесс экзамена в несколько потоков по числу экзаменаторов"""
         try:
-            tasks = [self.make_exam_slot_a(examiner) for examiner in self.__examiners]
-            await asyncio.gather(*tasks)
+            if self.instrumentation is not None:
+                self.instrumentation.start(self.clock.now())
+            self.seats = list(self.__examiners)
+            tasks = [self.make_exam_slot_a(examiner, number) for number, examiner in enumerate(self.seats)]
+            await self.clock.gather(*tasks)
+            if self.instrumentation is not None:
+                self.instrumentation.finish(self.clock.now())
+            if self.checkpoint is not None:
+                await self.checkpoint.wait()
         except Exception as e:
             print(f"[ERROR] Ошибка запуска экзамена: {e}")
 
-    async def make_exam_slot_a(self, examiner) -> None:
-        """Моделирует процесс экзамена по заданным условиям"""
-        lunch_flag = 0
+    async def make_exam_slot_a(self, examiner, number: int = 0) -> None:
+        """Моделирует процесс экзамена по заданным условиям (number — номер экзаменатора в очереди)"""
+        rng = self.rng_for(number)
+        # После возобновления сначала доводим до конца прерванный обед или экзамен
+        resumed = self.in_progress.get(number)
+        if resumed is not None and resumed[0] == 'lunch':
+            await self.lunch(number, examiner, *resumed[1:])
+        elif resumed is not None:
+            await self.examine(number, examiner, *resumed[1:])
+
         while True:
             # Проверяем, нужно ли уйти на обед
             current_time = self.statistics.get_examiner_work_time(examiner)
-            if lunch_flag:
+            if number in self.lunched:
                 self.statistics.set_examiner_have_luch(examiner, False)
 
-            if current_time >= 30.0 and not lunch_flag:
-                lunch_time = random.uniform(12, 18)
-                lunch_flag = 1
+            if current_time >= 30.0 and number not in self.lunched:
+                lunch_time = rng.uniform(12, 18)
+                self.lunched.add(number)
                 self.statistics.set_examiner_have_luch(examiner, True)
-                await asyncio.sleep(lunch_time)
+                if self.events is not None:
+                    self.events.emit("lunch_start", self.clock.now(), examiner=str(examiner),
+                                     duration=round(lunch_time, 3))
+                now = self.clock.now()
+                await self.lunch(number, examiner, now, now + lunch_time)
                 continue
 
-            async with self.lock:
-                student = self.get_student()
-                self.statistics.assign_student_to_examiner(examiner, student)
-                if not student:
-                    return
+            # Между await код выполняется без переключений, поэтому блокировка не нужна:
+            # студента выдаёт диспетчер, а запись экзаменатора меняет только его корутина
+            student = self.get_student(examiner, number)
+            self.statistics.assign_student_to_examiner(examiner, student)
+            if not student:
+                if self.instrumentation is not None:
+                    self.instrumentation.examiner_finished(examiner, self.clock.now())
+                return
+            if self.instrumentation is not None:
+                self.instrumentation.student_assigned(self.clock.now())
+            if self.events is not None:
+                self.events.emit("assignment", self.clock.now(), examiner=str(examiner), student=str(student))
 
-                questions = random.sample(self.__questions, 3)
+            questions = self.__questions.sample(3, rng)
 
-            time_spent_sec = random.uniform(*self.get_len_exam(examiner))
+            time_spent_sec = rng.uniform(*self.get_len_exam(examiner))
 
             # Обработка вопросов
             res_list = []
             for question in questions:
-                slot = Exam(examiner, student, question)
+                slot = Exam(examiner, student, self.__questions.tokens(question), rng)
                 answer = slot.check_answer()
                 if answer:
-                    async with self.lock:
-                        self.statistics.make_questions_dict(question)
+                    self.statistics.make_questions_dict(question)
+                if self.events is not None:
+                    self.events.emit("question_answered", self.clock.now(), examiner=str(examiner),
+                                     student=str(student), question=question, correct=answer)
                 res_list.append(answer)
             result: bool
-            rand = random.random()
+            rand = rng.random()
             if rand < 0.125:
                 result = False
             elif rand < 0.25:
@@ -105,15 +224,38 @@ class ExamManager:
             else:
                 result = res_list.count(True) > res_list.count(False)
 
-            await asyncio.sleep(time_spent_sec)
+            now = self.clock.now()
+            await self.examine(number, examiner, student, result, time_spent_sec, now, now + time_spent_sec)
+
+    async def lunch(self, number: int, examiner: Person, started: float, until: float) -> None:
+        """Обед экзаменатора до момента until"""
+        self.in_progress[number] = ('lunch', started, until)
+        await self.clock.sleep_until(until)
+        del self.in_progress[number]
+        if self.instrumentation is not None:
+            self.instrumentation.examiner_lunch(examiner, self.clock.now() - started)
+        if self.events is not None:
+            self.events.emit("lunch_end", self.clock.now(), examiner=str(examiner))
+
+    async def examine(self, number: int, examiner: Person, student: Person, result: bool, time_spent_sec: float,
+                      started: float, until: float) -> None:
+        """Экзамен студента до момента until и запись его итога в статистику"""
+        self.in_progress[number] = ('exam', student, result, time_spent_sec, started, until)
+        await self.clock.sleep_until(until)
+        del self.in_progress[number]
+        if self.instrumentation is not None:
+            self.instrumentation.student_examined(examiner, self.clock.now() - started)
 
-            async with self.lock:
-                self.statistics.update_examiner_stats(examiner, result, time_spent_sec)
-                self.statistics.update_student_stats(student, result, time_spent_sec)
-                self.statistics.num_student_in_queue -= 1
-            # await asyncio.sleep(time_spent_sec)
+        self.statistics.update_examiner_stats(examiner, result, time_spent_sec)
+        self.statistics.update_student_stats(student, result, time_spent_sec)
+        self.statistics.num_student_in_queue -= 1
+        if self.events is not None:
+            self.events.emit("result", self.clock.now(), examiner=str(examiner), student=str(student),
+                             passed=result, time_spent=round(time_spent_sec, 3))
+        if self.checkpoint is not None and self.checkpoint.due():
+            self.checkpoint.save(self.get_state())
 
     @staticmethod
     def get_len_exam(examiner: Person) -> tuple[int, int]:
         """Возвращает длительность экзамена в зависимости от имени экзаменатора"""
-        return len(examiner.first_name) - 1, len(examiner.first_name) + 1
+        return examiner.name_len - 1, examiner.name_len + 1
@@ -1,18 +1,222 @@
 import asyncio
-from collections import defaultdict
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
+import copy
+import heapq
+import operator
+from array import array
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING
 
 from .person import Person
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
+
+
+class ExaminerRecord:
+    """Статистика одного экзаменатора"""
+    __slots__ = ('current_student', 'total_students', 'failed_students', 'time_worked', 'on_lunch_break')
+
+    def __init__(self) -> None:
+        self.current_student = None
+        self.total_students = 0
+        self.failed_students = 0
+        self.time_worked = 0.0
+        self.on_lunch_break = False
+
+
+class StatusIndex:
+    """
+    Множество индексов студентов одного статуса в виде дерева Фенвика с дописыванием:
+    добавление и удаление индекса, а также k-й по порядку индекс стоят O(log n),
+    поэтому окно таблицы строится без прохода по всем студентам до него
+    """
+    __slots__ = ('tree', 'count')
+
+    def __init__(self) -> None:
+        self.tree = array('i', [0])  # tree[i] — число индексов в (i - lowbit(i), i]
+        self.count = 0
+
+    def append(self, present: bool) -> None:
+        """Дописывает следующий индекс (входящий во множество или нет)"""
+        i = len(self.tree)
+        total = int(present)
+        j, stop = i - 1, i - (i & -i)
+        while j > stop:
+            total += self.tree[j]
+            j -= j & -j
+        self.tree.append(total)
+        self.count += present
+
+    def change(self, index: int, delta: int) -> None:
+        """Добавляет (delta=1) или удаляет (delta=-1) уже дописанный индекс"""
+        i = index + 1
+        size = len(self.tree)
+        while i < size:
+            self.tree[i] += delta
+            i += i & -i
+        self.count += delta
+
+    def find_kth(self, k: int) -> int:
+        """Возвращает k-й (с нуля) индекс множества по возрастанию"""
+        position = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            node = position + step
+            if node < len(self.tree) and self.tree[node] <= k:
+                position = node
+                k -= self.tree[node]
+            step >>= 1
+        return position
+
+    def __getitem__(self, rows: slice) -> list[int]:
+        return [self.find_kth(k) for k in range(*rows.indices(self.count))]
+
+    def copy(self) -> 'StatusIndex':
+        copied = StatusIndex.__new__(StatusIndex)
+        copied.tree = self.tree[:]
+        copied.count = self.count
+        return copied
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class StudentColumns:
+    """
+    Колоночное хранилище статистики студентов: каждому студенту выдаётся
+    целочисленный индекс, статус хранится кодом в array('b'), время — в array('d').
+    Индексы дополнительно разложены по статусам (StatusIndex), поэтому смена статуса
+    стоит O(log n), а окно таблицы строится без сортировки и без прохода до смещения
+    """
+    __slots__ = ('persons', 'index', 'status', 'time_spent', 'buckets')
+
+    def __init__(self) -> None:
+        self.persons = []
+        self.index = {}
+        self.status = array('b')
+        self.time_spent = array('d')
+        self.buckets = tuple(StatusIndex() for _ in ExamStatistics.STUDENT_STATUSES)
+
+    def add(self, person: Person) -> int:
+        """Добавляет студента (если его ещё нет) и возвращает его индекс"""
+        index = self.index.get(person)
+        if index is None:
+            index = self.index[person] = len(self.persons)
+            self.persons.append(person)
+            self.status.append(ExamStatistics.STATUS_QUEUE)
+            self.time_spent.append(0.0)
+            for status, bucket in enumerate(self.buckets):
+                bucket.append(status == ExamStatistics.STATUS_QUEUE)
+        return index
+
+    def set_status(self, index: int, status: int) -> None:
+        """Меняет статус студента, перекладывая его в множество нового статуса"""
+        old_status = self.status[index]
+        if old_status != status:
+            self.buckets[old_status].change(index, -1)
+            self.buckets[status].change(index, 1)
+            self.status[index] = status
+
+    def window(self, offset: int, limit: int) -> list[int]:
+        """
+        Возвращает индексы студентов с offset по offset + limit в порядке статусов
+        (внутри статуса — в порядке индексов) за O(limit · log n)
+        """
+        rows = []
+        for bucket in self.buckets:
+            if offset >= len(bucket):
+                offset -= len(bucket)
+                continue
+            rows.extend(bucket[offset:offset + limit - len(rows)])
+            offset = 0
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def __deepcopy__(self, memo) -> 'StudentColumns':
+        """Копирует колонки целиком (люди общие: они неизменяемы), без прохода по студентам"""
+        copied = StudentColumns.__new__(StudentColumns)
+        copied.persons = self.persons.copy()
+        copied.index = self.index.copy()
+        copied.status = self.status[:]
+        copied.time_spent = self.time_spent[:]
+        copied.buckets = tuple(bucket.copy() for bucket in self.buckets)
+        return copied
+
+    def __len__(self) -> int:
+        return len(self.persons)
+
+
+class Leaderboard:
+    """
+    Текущий экстремум с набором равных ему участников.
+    Поддерживается при каждом обновлении, поэтому запрос стоит O(ties)
+    """
+    __slots__ = ('better', 'best', 'ties')
+
+    def __init__(self, better=operator.lt) -> None:
+        self.better = better
+        self.best = None
+        self.ties = {}
+
+    def offer(self, key, value, order: int) -> None:
+        """Учитывает новое значение участника (значения участников не ухудшаются повторно)"""
+        if self.best is None or self.better(value, self.best):
+            self.best = value
+            self.ties = {key: order}
+        elif value == self.best:
+            self.ties[key] = order
+
+    def winners(self) -> list:
+        """Возвращает участников с лучшим значением в порядке их номеров"""
+        return sorted(self.ties, key=self.ties.__getitem__)
+
+
+class RateBoard:
+    """
+    Минимум по значениям, которые могут и расти, и убывать (доля проваленных у экзаменатора).
+    Участники сгруппированы по значению, а значения лежат в куче с ленивым удалением
+    """
+    __slots__ = ('groups', 'heap', 'values')
+
+    def __init__(self) -> None:
+        self.groups = {}
+        self.heap = []
+        self.values = {}
+
+    def update(self, key, value, order: int) -> None:
+        """Переносит участника в группу нового значения"""
+        old_value = self.values.get(key)
+        if old_value is not None:
+            group = self.groups[old_value]
+            del group[key]
+            if not group:
+                del self.groups[old_value]
+        self.values[key] = value
+        if value not in self.groups:
+            self.groups[value] = {}
+            heapq.heappush(self.heap, value)
+        self.groups[value][key] = order
+
+    def winners(self) -> list:
+        """Возвращает участников с минимальным значением в порядке их номеров"""
+        while self.heap and self.heap[0] not in self.groups:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            return []
+        group = self.groups[self.heap[0]]
+        return sorted(group, key=group.__getitem__)
+
 
 class ExamStatistics:
     STUDENT_STATUSES = ('Очередь', 'Сдал', 'Провалил')
+    STATUS_QUEUE, STATUS_PASSED, STATUS_FAILED = range(len(STUDENT_STATUSES))
     STUDENT_INDICATORS_TITLES = ('Студент', 'Статус')
+    # Панель студентов занимает 13 строк: заголовок, рамки, шапка и подпись съедают 6 из них
+    STUDENTS_PANEL_SIZE = 13
+    STUDENTS_PAGE_SIZE = STUDENTS_PANEL_SIZE - 6
+    STUDENTS_TABLE_WIDTH = 72
     EXAMINERS_INDICATORS_TITLES = ('Экзаменатор', 'Текущий студент', 'Всего студентов', 'Завалил', 'Время работы')
     FINAL_INDICATORS_TITLES = ('Экзаменатор', 'Всего студентов', 'Завалил', 'Время работы')
 
@@ -20,11 +224,27 @@ class ExamStatistics:
         self.students_queue = students_queue
         self.examiners_queue = examiners_queue
 
-        self.students_stat_dict = {}
-        self.examiners_stat_dict = {}
+        self.students_stats = StudentColumns()
+        self.examiners_stats = {}
         self.questions_stat_dict = defaultdict(int)
-        self.num_student_in_queue = 0
-        self.lock = asyncio.Lock()
+        self.students_offset = 0
+        self.students_page_size = self.STUDENTS_PAGE_SIZE
+        # Включена ли прокрутка таблицы студентов с клавиатуры (presentation.scroll_keys)
+        self.scroll_keys = False
+        self.version = 0
+        self.changed = asyncio.Event()
+        self._num_student_in_queue = 0
+
+        # Агрегаты для итогов, поддерживаемые инкрементально
+        self.exam_time = 0.0
+        self.total_students = 0
+        self.failed_students = 0
+        self.best_students = Leaderboard()
+        self.first_failed_students = Leaderboard()
+        self.best_examiners = RateBoard()
+        self.best_questions = Leaderboard(better=operator.gt)
+        self.examiners_order = {}
+        self.questions_order = {}
 
         if students_queue:
             self.make_students_dict()
@@ -33,193 +253,238 @@ class ExamStatistics:
         if examiners_queue:
             self.make_examiners_dict()
 
+    def __getstate__(self) -> dict:
+        """Состояние для pickle (для передачи между процессами): событие не сериализуется"""
+        state = self.__dict__.copy()
+        del state['changed']
+        # Диспетчер заменяется копией его очереди
+        state['students_queue'] = deque(self.students_queue or ())
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.changed = asyncio.Event()
+        self.scroll_keys = False
+
+    def snapshot(self) -> 'ExamStatistics':
+        """
+        Независимая копия статистики для контрольной точки: дальнейший ход экзамена её не меняет,
+        поэтому сериализовать копию можно в отдельном потоке
+        """
+        state = self.__getstate__()
+        students_queue = state.pop('students_queue')  # уже копия
+        state = copy.deepcopy(state)
+        state['students_queue'] = students_queue
+        snapshot = ExamStatistics.__new__(ExamStatistics)
+        snapshot.__setstate__(state)
+        return snapshot
+
+    def merge(self, other: 'ExamStatistics') -> 'ExamStatistics':
+        """
+        Объединяет статистику двух частей экзамена в новую (операция ассоциативна).
+        Студенты объединяются, счётчики экзаменаторов и вопросов складываются
+        (если один экзаменатор принимал в обеих частях, его время работы суммируется)
+        """
+        merged = ExamStatistics()
+        merged.students_queue = deque()
+        merged.examiners_queue = deque()
+
+        for part in (self, other):
+            students = part.students_stats
+            for index, person in enumerate(students.persons):
+                merged_index = merged.students_stats.add(person)
+                merged.students_stats.set_status(merged_index, students.status[index])
+                merged.students_stats.time_spent[merged_index] = students.time_spent[index]
+
+            for examiner, stats in part.examiners_stats.items():
+                if examiner not in merged.examiners_stats:
+                    merged.examiners_stats[examiner] = ExaminerRecord()
+                    merged.examiners_order[examiner] = len(merged.examiners_order)
+                    merged.examiners_queue.append(examiner)
+                record = merged.examiners_stats[examiner]
+                record.total_students += stats.total_students
+                record.failed_students += stats.failed_students
+                record.time_worked += stats.time_worked
+
+            for question, count in part.questions_stat_dict.items():
+                merged.questions_stat_dict[question] += count
+                merged.questions_order.setdefault(question, len(merged.questions_order))
+
+            merged._num_student_in_queue += part.num_student_in_queue
+
+        merged._rebuild_aggregates()
+        return merged
+
+    def _rebuild_aggregates(self) -> None:
+        """Пересчитывает все инкрементальные агрегаты по хранилищам с нуля"""
+        self.exam_time = max((stats.time_worked for stats in self.examiners_stats.values()), default=0.0)
+        self.total_students = sum(stats.total_students for stats in self.examiners_stats.values())
+        self.failed_students = sum(stats.failed_students for stats in self.examiners_stats.values())
+        self.best_examiners = RateBoard()
+        for examiner, stats in self.examiners_stats.items():
+            if stats.total_students:
+                self.best_examiners.update(examiner, stats.failed_students / stats.total_students,
+                                           self.examiners_order[examiner])
+        self._rebuild_student_boards()
+        self._rebuild_best_questions()
+
+    @property
+    def num_student_in_queue(self) -> int:
+        """Количество студентов, ещё не закончивших экзамен"""
+        return self._num_student_in_queue
+
+    @num_student_in_queue.setter
+    def num_student_in_queue(self, value: int) -> None:
+        self._num_student_in_queue = value
+        self.touch()
+
+    def touch(self) -> None:
+        """Отмечает изменение статистики: увеличивает версию и будит отрисовку"""
+        self.version += 1
+        self.changed.set()
+
     def make_students_dict(self) -> None:
-        """Создаёт словарь статусов для студентов"""
+        """Заполняет хранилище статусов для студентов"""
         for student in self.students_queue:
-            self.students_stat_dict[student] = {
-                "student_status": self.STUDENT_STATUSES[0],
-                "time_spent": 0.0
-            }
+            self.students_stats.add(student)
 
     def make_examiners_dict(self) -> None:
         """Создаёт словарь статистики для экзаменаторов"""
         for examiner in self.examiners_queue:
-            self.examiners_stat_dict[examiner] = {
-                "current_student": None,
-                "total_students": 0,
-                "failed_students": 0,
-                "time_worked": 0.0,
-                "on_lunch_break": False
-            }
+            self.examiners_stats[examiner] = ExaminerRecord()
+            self.examiners_order.setdefault(examiner, len(self.examiners_order))
 
     def make_questions_dict(self, question: str, result=1) -> None:
         """Создаёт словарь верно отвеченных вопросов"""
         self.questions_stat_dict[question] += result
+        order = self.questions_order.setdefault(question, len(self.questions_order))
+        if result < 0 and question in self.best_questions.ties:
+            self._rebuild_best_questions()
+        else:
+            self.best_questions.offer(question, self.questions_stat_dict[question], order)
+        self.touch()
 
     def assign_student_to_examiner(self, examiner: Person, student: Person) -> None:
         """Вносит в словарь экзаменаторов текущего студента"""
-        stats = self.examiners_stat_dict[examiner]
-        stats["current_student"] = student
+        self.examiners_stats[examiner].current_student = student
+        self.touch()
 
     def update_examiner_stats(self, examiner: Person, result: int, time_spent: float) -> None:
         """Вносит в словарь экзаменаторов статистику экзамена"""
-        stats = self.examiners_stat_dict[examiner]
-        stats["total_students"] += 1
+        stats = self.examiners_stats[examiner]
+        stats.total_students += 1
         if not result:
-            stats["failed_students"] += 1
-        stats["time_worked"] += time_spent
+            stats.failed_students += 1
+        stats.time_worked += time_spent
+
+        self.total_students += 1
+        if not result:
+            self.failed_students += 1
+        self.exam_time = max(self.exam_time, stats.time_worked)
+        self.best_examiners.update(examiner, stats.failed_students / stats.total_students,
+                                   self.examiners_order[examiner])
+        self.touch()
 
     def update_student_stats(self, student: Person, result:int, time_spent: float) -> None:
-        """Вносит в словарь статистику студента"""
-        stats = self.students_stat_dict[student]
-        if result:
-            stats["student_status"] = ExamStatistics.STUDENT_STATUSES[1]
+        """Вносит в хранилище статистику студента"""
+        students = self.students_stats
+        index = students.index[student]
+        already_examined = students.status[index] != self.STATUS_QUEUE
+        students.set_status(index, self.STATUS_PASSED if result else self.STATUS_FAILED)
+        students.time_spent[index] = time_spent
+
+        if already_examined:
+            self._rebuild_student_boards()
         else:
-            stats["student_status"] = ExamStatistics.STUDENT_STATUSES[2]
-        stats["time_spent"] = time_spent
+            board = self.best_students if result else self.first_failed_students
+            board.offer(student, time_spent, index)
+        self.touch()
+
+    def _rebuild_student_boards(self) -> None:
+        """Пересчитывает лидеров среди студентов с нуля (нужно, только если студента переэкзаменовали)"""
+        self.best_students = Leaderboard()
+        self.first_failed_students = Leaderboard()
+        students = self.students_stats
+        for index, status in enumerate(students.status):
+            if status == self.STATUS_PASSED:
+                self.best_students.offer(students.persons[index], students.time_spent[index], index)
+            elif status == self.STATUS_FAILED:
+                self.first_failed_students.offer(students.persons[index], students.time_spent[index], index)
+
+    def _rebuild_best_questions(self) -> None:
+        """Пересчитывает лучшие вопросы с нуля (нужно, только если счётчик уменьшился)"""
+        self.best_questions = Leaderboard(better=operator.gt)
+        for question, count in self.questions_stat_dict.items():
+            self.best_questions.offer(question, count, self.questions_order[question])
 
     def get_exam_time(self) -> float:
         """Возвращает длительность экзамена(максимум по экзаменаторам)"""
-        return max(
-            stat["time_worked"] for stat in self.examiners_stat_dict.values()
-        )
-
-    def get_all_best_examiners(self) -> list[tuple[Person, float]]:
-        """Ищем лучшего экзаменатора. Возвращает список кортежей (экзаменатор, время экзамена)"""
-        all_with_rate = [
-            (examiner, stat["failed_students"] / stat["total_students"])
-            for examiner, stat in self.examiners_stat_dict.items()
-            if stat["total_students"] > 0
-        ]
-
-        # Находим минимальное значение провала
-        if not all_with_rate:
-            return []
-
-        min_rate = min(all_with_rate, key=lambda x: x[1])[1]
-
-        # Фильтруем всех экзаменаторов с этим минимумом
-        best_examiners = [item[0] for item in all_with_rate if item[1] == min_rate]
-        return best_examiners
-
-    def get_all_best_students(self) -> list[tuple[Person, float]]:
-        """Ищем лучшего студента. Возвращает список кортежей (студент, время экзамена)"""
-        all_with_rate = [
-            (student, stat["time_spent"])
-            for student, stat in self.students_stat_dict.items()
-            if stat["student_status"] == ExamStatistics.STUDENT_STATUSES[1]
-        ]
-
-        if not all_with_rate:
-            return []
+        return self.exam_time
 
-        min_rate = min(all_with_rate, key=lambda x: x[1])[1]
+    def get_all_best_examiners(self) -> list[Person]:
+        """Ищем лучших экзаменаторов (с минимальной долей проваленных студентов)"""
+        return self.best_examiners.winners()
 
-        # Фильтруем всех студентов с этим минимумом
-        best_students = [item[0] for item in all_with_rate if item[1] == min_rate]
-        return best_students
+    def get_all_best_students(self) -> list[Person]:
+        """Ищем лучших студентов (быстрее всех сдавших экзамен)"""
+        return self.best_students.winners()
 
-    def get_all_failed_students(self) -> list[tuple[Person, float]]:
-        """Ищем худшего студента. Возвращает список кортежей (студент, время экзамена)"""
-        all_with_rate = [
-            (student, stat["time_spent"])
-            for student, stat in self.students_stat_dict.items()
-            if stat["student_status"] == ExamStatistics.STUDENT_STATUSES[2]
-        ]
+    def get_all_failed_students(self) -> list[Person]:
+        """Ищем худших студентов (раньше всех проваливших экзамен)"""
+        return self.first_failed_students.winners()
 
-        if not all_with_rate:
-            return []
-
-        min_rate = min(all_with_rate, key=lambda x: x[1])[1]
-
-        # Фильтруем всех студентов с этим минимумом
-        failed_students = [item[0] for item in all_with_rate if item[1] == min_rate]
-        return failed_students
-
-    def get_all_best_questions(self) -> list[tuple[str, int]]:
-        """Лучший вопрос. Возвращает список кортежей (вопрос, количество правильных ответов)"""
-        if not self.questions_stat_dict:
-            return []
-
-        max_count = max(self.questions_stat_dict.values())
-        best_questions = [
-            question
-            for question, count in self.questions_stat_dict.items()
-            if count == max_count
-        ]
-        return best_questions
+    def get_all_best_questions(self) -> list[str]:
+        """Лучшие вопросы (с наибольшим числом правильных ответов)"""
+        return self.best_questions.winners()
 
     def get_exam_summary(self, success_goal=0.85) -> bool:
         """Вывод, удался экзамен или нет (экзамен удался, если сдало больше 85% студентов)"""
-        sum_fail = sum(values["failed_students"] for values in self.examiners_stat_dict.values())
-        total_students = sum(values["total_students"] for values in self.examiners_stat_dict.values())
+        if not self.total_students:
+            return False
+        return (1 - self.failed_students / self.total_students) > success_goal
 
-        return False if not total_students else (1 - sum_fail / total_students) > success_goal
-
-    def get_examiners_table(self) -> Table:
+    def get_examiners_table(self) -> 'Table':
         """Создаёт таблицу экзаменаторов с текущей статистикой"""
-        table = Table(title="Статистика экзаменаторов")
-        for title in self.EXAMINERS_INDICATORS_TITLES:
-            table.add_column(title)
-
-        for examiner, stats in self.examiners_stat_dict.items():
-            row = [
-                str(examiner),
-                str(stats["current_student"]) if stats["current_student"] and not stats["on_lunch_break"] else "-",
-                str(stats["total_students"]),
-                str(stats["failed_students"]),
-                f"{stats['time_worked']:.2f} сек"
-            ]
-            table.add_row(*row)
-
-        return table
-
-    def get_students_table(self) -> Table:
-        """Создаёт таблицу студентов с текущей статистикой"""
-        table = Table(title="Статистика студентов")
-        for title in self.STUDENT_INDICATORS_TITLES:
-            table.add_column(title)
-
-        sorted_students = sorted(
-            self.students_stat_dict.items(),
-            key=lambda item: self.STUDENT_STATUSES.index(item[1]["student_status"])
+        from . import presentation
+        return presentation.examiners_table(self)
+
+    def scroll_students(self, rows: int) -> None:
+        """Прокручивает таблицу студентов на rows строк (отрицательное значение — вверх)"""
+        last_offset = max(len(self.students_stats) - self.students_page_size, 0)
+        offset = min(max(self.students_offset + rows, 0), last_offset)
+        if offset != self.students_offset:
+            self.students_offset = offset
+            self.touch()
+
+    def get_students_counts_text(self) -> str:
+        """Возвращает строку с количеством студентов в каждом статусе"""
+        return ", ".join(
+            f"{status}: {len(bucket)}"
+            for status, bucket in zip(self.STUDENT_STATUSES, self.students_stats.buckets)
         )
 
-        for student, stats in sorted_students:
-            row = [
-                str(student),
-                str(stats["student_status"])
-            ]
-            table.add_row(*row)
-
-        return table
+    def get_students_table(self) -> 'Table':
+        """Создаёт таблицу студентов с текущей статистикой (только видимое окно)"""
+        from . import presentation
+        return presentation.students_table(self)
 
-    def get_final_table(self) -> Table:
+    def get_final_table(self) -> 'Table':
         """Создаёт итоговую таблицу экзаменаторов с текущей статистикой"""
-        table = Table(title="Итоговая статистика")
-        for title in self.FINAL_INDICATORS_TITLES:
-            table.add_column(title)
-
-        for examiner, stats in self.examiners_stat_dict.items():
-            row = [
-                str(examiner),
-                str(stats["total_students"]),
-                str(stats["failed_students"]),
-                f"{stats['time_worked']:.2f} сек"
-            ]
-            table.add_row(*row)
-
-        return table
+        from . import presentation
+        return presentation.final_table(self)
 
     def get_examiner_work_time(self, examiner) -> float:
         """Возвращает время работы конкретного экзаменатора"""
-        stats = self.examiners_stat_dict.get(examiner, {})
-        return stats.get("time_worked", 0.0)
+        stats = self.examiners_stats.get(examiner)
+        return stats.time_worked if stats else 0.0
 
     def set_examiner_have_luch(self, examiner, have_lunch: bool) -> bool:
         """Устанавливает, обедает ли экзаменатор сейчас"""
-        if examiner in self.examiners_stat_dict:
-            self.examiners_stat_dict[examiner]["on_lunch_break"] = have_lunch
+        if examiner in self.examiners_stats:
+            stats = self.examiners_stats[examiner]
+            if stats.on_lunch_break != have_lunch:
+                stats.on_lunch_break = have_lunch
+                self.touch()
             return True
         return False
 
@@ -230,21 +495,41 @@ class ExamStatistics:
         return (f"[bold]Осталось в очереди[/]: {students_left}\n"
                 f"[bold]Время с момента начала экзамена[/]: {time_total:0.2f} сек")
 
+    def get_summary_info(self) -> dict:
+        """Возвращает итог экзамена в виде словаря (для вывода в JSON)"""
+        return {
+            "exam_time": round(self.get_exam_time(), 3),
+            "best_students": [str(student) for student in self.get_all_best_students()],
+            "best_examiners": [str(examiner) for examiner in self.get_all_best_examiners()],
+            "failed_students": [str(student) for student in self.get_all_failed_students()],
+            "best_questions": self.get_all_best_questions(),
+            "success": self.get_exam_summary(),
+            "students": {
+                status: len(bucket)
+                for status, bucket in zip(self.STUDENT_STATUSES, self.students_stats.buckets)
+            },
+            "examiners": [
+                {
+                    "examiner": str(examiner),
+                    "total_students": stats.total_students,
+                    "failed_students": stats.failed_students,
+                    "time_worked": round(stats.time_worked, 3),
+                }
+                for examiner, stats in self.examiners_stats.items()
+            ],
+        }
+
     def get_summary_info_text(self) -> str:
         """Возвращает строку с информацией об итоге экзамена"""
-        time_total = self.get_exam_time()
-        best_students = self.get_all_best_students()
-        best_examiners = self.get_all_best_examiners()
-        failed_students = self.get_all_failed_students()
-        best_questions = self.get_all_best_questions()
-        exam_summary = "экзамен удался" if self.get_exam_summary() else "экзамен не удался"
+        summary = self.get_summary_info()
+        exam_summary = "экзамен удался" if summary["success"] else "экзамен не удался"
         return (
-            f"[bold]Время с момента начала экзамена и до момента и его завершения:[/] {time_total:.2f} сек\n"
-            f"[bold]Имена лучших студентов:[/] {self.format_list(best_students, style='green')}\n"
-            f"[bold]Имена лучших экзаменаторов:[/] {self.format_list(best_examiners, style='blue')}\n"
+            f"[bold]Время с момента начала экзамена и до момента и его завершения:[/] {self.get_exam_time():.2f} сек\n"
+            f"[bold]Имена лучших студентов:[/] {self.format_list(summary['best_students'], style='green')}\n"
+            f"[bold]Имена лучших экзаменаторов:[/] {self.format_list(summary['best_examiners'], style='blue')}\n"
             f"[bold]Имена студентов, которых после экзамена отчислят:[/] "
-            f"{self.format_list(failed_students, style='red')}\n"
-            f"[bold]Лучшие вопросы:[/] {self.format_list(best_questions, style='yellow')}\n"
+            f"{self.format_list(summary['failed_students'], style='red')}\n"
+            f"[bold]Лучшие вопросы:[/] {self.format_list(summary['best_questions'], style='yellow')}\n"
             f"[bold]Вывод:[/] {exam_summary}\n"
         )
 
@@ -258,52 +543,12 @@ class ExamStatistics:
             str_items = [f"[{style}]{item}[/{style}]" for item in str_items]
         return ", ".join(str_items)
 
-    def get_layout(self) -> Panel:
+    def get_layout(self) -> 'Panel':
         """Возвращает панель из объектов библиотеки rich"""
-        layout = Layout()
-        layout.split(
-            Layout(name="students", renderable=self.get_students_table(), size=13),
-            Layout(name="examiners", renderable=self.get_examiners_table() if self.num_student_in_queue \
-                else self.get_final_table()),
-            Layout(name="footer", renderable=self.get_accompanying_info_text() if self.num_student_in_queue \
-                else self.get_summary_info_text()),
-
-        )
-        return Panel(layout, title="📊 Экзамен", border_style="blue")
-
-    async def update_both_tables(self, interval=1) -> None:
-        """Управляет обновлением информации о ходе экзамена при изменении состояния"""
-        prev_examiner_state = self._get_examiner_state()
-        prev_student_state = self._get_student_state()
-
-        with Live(self.get_layout(), refresh_per_second=4, console=console) as live:
-            while True:
-                curr_examiner_state = self._get_examiner_state()
-                curr_student_state = self._get_student_state()
-
-                if curr_examiner_state != prev_examiner_state or curr_student_state != prev_student_state:
-                    live.update(self.get_layout())
-                    prev_examiner_state = curr_examiner_state
-                    prev_student_state = curr_student_state
-
-                async with self.lock:
-                    if not self.num_student_in_queue:
-                        live.update(self.get_layout())
-                        break
-
-                await asyncio.sleep(interval)
-
-    def _get_examiner_state(self) -> tuple:
-        """Возвращает текущее состояние словаря экзаменаторов"""
-        return tuple(
-            (examiner, stat["current_student"], stat["total_students"],
-             stat["failed_students"], stat["time_worked"], stat["on_lunch_break"])
-            for examiner, stat in self.examiners_stat_dict.items()
-        )
+        from . import presentation
+        return presentation.layout(self)
 
-    def _get_student_state(self) -> tuple:
-        """Возвращает текущее состояние словаря студентов"""
-        return tuple(
-            (student, status)
-            for student, status in self.students_stat_dict.items()
-        )
\ No newline at end of file
+    async def update_both_tables(self, min_frame_interval=0.25) -> None:
+        """Перерисовывает таблицы при изменении статистики (см. presentation.update_both_tables)"""
+        from . import presentation
+        await presentation.update_both_tables(self, min_frame_interval)
@@ -1,33 +1,79 @@
+import mmap
+import os
+import struct
+
+from .compiled import compiled_path, load_persons, load_questions
+from .person import Person
+from .question_bank import QuestionBank
+
 class FileReader:
-    def __init__(self, filename):
+    def __init__(self, filename, use_compiled=True):
         self.filename = filename
+        # Если рядом лежит свежий скомпилированный файл (.bin), данные читаются из него
+        self.use_compiled = use_compiled
+
+    def load_compiled(self, loader):
+        """
+        Возвращает данные из скомпилированного файла или None,
+        если его нет, он устарел или не читается — например, пуст или собран
+        другой версией формата (тогда читается текстовый файл)
+        """
+        path = compiled_path(self.filename)
+        if not self.use_compiled or not os.path.exists(path):
+            return None
+        try:
+            data = loader(path, self.filename)
+        except (ValueError, struct.error, OSError) as e:
+            print(f"[warn] Файл '{path}' не читается ({e}) — читается '{self.filename}'")
+            return None
+        if data is None:
+            print(f"[warn] Файл '{path}' устарел — читается '{self.filename}'")
+        return data
 
     def read_persons(self) -> list:
         """
         Возвращает список [first_name, last_name] из файла или выбрасывает исключение,
         если файл пуст или содержит неверные данные
         """
-        persons_list = []
-
-        try:
-            with open(self.filename, 'r', encoding='UTF-8') as file:
-                lines = [line.strip() for line in file.readlines()]
+        return list(self.iter_persons())
 
-                # Проверяем, есть ли вообще строки
-                if not lines:
-                    raise ValueError(f"Файл '{self.filename}' пуст")
+    def load_persons(self, use_mmap=False) -> list[Person]:
+        """
+        Возвращает список проверенных объектов Person: из свежего скомпилированного файла
+        без повторной проверки, иначе из текстового файла (как iter_persons + Person.build_all).
+        Выбрасывает исключение, если файл пуст или содержит неверные данные
+        """
+        persons = self.load_compiled(load_persons)
+        if persons is None:
+            return Person.build_all(self.iter_persons(use_mmap))
+        if not persons:
+            print(f"Произошла ошибка при чтении файла: Файл '{self.filename}' пуст")
+            raise ValueError(f"Файл '{self.filename}' пуст")
+        return persons
 
-                for line in lines:
-                    if not line:
-                        continue  # пропускаем пустые строки
+    def iter_persons(self, use_mmap=False):
+        """
+        Лениво возвращает записи [first_name, last_name] из текстового файла по одной,
+        не держа весь файл в памяти. Выбрасывает исключение, если файл пуст
+        или строка содержит неверные данные (с номером строки)
+        """
+        try:
+            is_empty = True
+            for line_number, line in enumerate(self._iter_lines(use_mmap), start=1):
+                is_empty = False
+                line = line.strip()
+                if not line:
+                    continue  # пропускаем пустые строки
 
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        persons_list.append(parts[:2])
-                    else:
-                        raise ValueError(f"Строка игнорируется (слишком мало данных): {line}")
+                parts = line.split()
+                if len(parts) >= 2:
+                    yield parts[:2]
+                else:
+                    raise ValueError(f"Строка {line_number} игнорируется (слишком мало данных): {line}")
 
-            return persons_list
+            # Проверяем, есть ли вообще строки
+            if is_empty:
+                raise ValueError(f"Файл '{self.filename}' пуст")
 
         except FileNotFoundError:
             print(f"Файл '{self.filename}' не найден.")
@@ -39,17 +85,34 @@ class FileReader:
             print(f"Произошла ошибка при чтении файла: {e}")
             raise
 
-    def read_questions(self) -> list:
+    def _iter_lines(self, use_mmap=False):
+        """Построчно читает файл: обычным буферизованным чтением или через mmap"""
+        if not use_mmap:
+            with open(self.filename, 'r', encoding='UTF-8') as file:
+                yield from file
+            return
+
+        with open(self.filename, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return  # пустой файл нельзя отобразить в память
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for raw_line in iter(mapped.readline, b''):
+                    yield raw_line.decode('UTF-8')
+
+    def read_questions(self) -> QuestionBank:
         """
-        Возвращает список строк
+        Возвращает банк вопросов (последовательность строк с заранее разбитыми словами)
         """
-        questions_list = []
+        questions_list = QuestionBank()
         try:
+            compiled = self.load_compiled(load_questions)
+            if compiled is not None:
+                return compiled
             with open(self.filename, 'r', encoding='UTF-8') as file:
                 for line in file:
                     question = line.strip()
                     if question:
-                        questions_list.append(question)
+                        questions_list.add(question)
                     else:
                         print("[warn] Пустая строка в файле вопросов — пропущена")
             if len(questions_list) >= 3:
@@ -0,0 +1,161 @@
+import math
+import time
+from typing import TYPE_CHECKING
+
+from .person import Person
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+class Histogram:
+    """
+    Логарифмическая гистограмма: корзина на каждую четверть степени двойки
+    (погрешность квантилей ~19%), память не зависит от числа значений.
+    Гистограммы можно складывать (merge)
+    """
+    SUB_BUCKETS = 4
+
+    __slots__ = ('buckets', 'zeros', 'count', 'total', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Добавляет значение (отрицательные считаются нулём)"""
+        self.count += 1
+        if value <= 0.0:
+            self.zeros += 1
+            self.min = 0.0
+            return
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        index = math.floor(math.log2(value) * self.SUB_BUCKETS)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        """Добавляет значения другой гистограммы"""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Возвращает оценку квантиля сверху (верхнюю границу корзины)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = self.zeros
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(2.0 ** ((index + 1) / self.SUB_BUCKETS), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "min": self.min if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Instrumentation:
+    """
+    Необязательные замеры хода экзамена (включаются передачей в ExamManager):
+    ожидание студентов в очереди и длительность их экзамена, интервалы работы,
+    простоя и обеда экзаменаторов, задержка выдачи студента диспетчером.
+    Время экзамена — по часам менеджера, задержка диспетчера — реальное (perf_counter)
+    """
+    HISTOGRAMS = {
+        "student_wait": "Ожидание в очереди",
+        "student_service": "Экзамен студента",
+        "examiner_busy": "Работа экзаменатора",
+        "examiner_idle": "Простой экзаменатора",
+        "examiner_lunch": "Обед экзаменатора",
+        "dispatch_latency": "Выдача студента (реальное время)",
+    }
+    INTERVALS = ("busy", "idle", "lunch")
+
+    def __init__(self) -> None:
+        self.histograms = {name: Histogram() for name in self.HISTOGRAMS}
+        self.examiners = {}
+        self.finished_at = {}
+        self.started_at = 0.0
+        self.timer = time.perf_counter
+
+    def start(self, now: float) -> None:
+        """Отмечает начало экзамена: все студенты встают в очередь"""
+        self.started_at = now
+
+    def _examiner_interval(self, examiner: Person, kind: str, duration: float) -> None:
+        totals = self.examiners.setdefault(examiner, dict.fromkeys(self.INTERVALS, 0.0))
+        totals[kind] += duration
+        self.histograms[f"examiner_{kind}"].record(duration)
+
+    def student_assigned(self, now: float) -> None:
+        self.histograms["student_wait"].record(now - self.started_at)
+
+    def student_examined(self, examiner: Person, duration: float) -> None:
+        self.histograms["student_service"].record(duration)
+        self._examiner_interval(examiner, "busy", duration)
+
+    def examiner_idle(self, examiner: Person, duration: float) -> None:
+        if duration > 0.0:
+            self._examiner_interval(examiner, "idle", duration)
+
+    def examiner_lunch(self, examiner: Person, duration: float) -> None:
+        self._examiner_interval(examiner, "lunch", duration)
+
+    def examiner_finished(self, examiner: Person, now: float) -> None:
+        """Экзаменатор ушёл: студенты кончились"""
+        self.examiners.setdefault(examiner, dict.fromkeys(self.INTERVALS, 0.0))
+        self.finished_at[examiner] = now
+
+    def dispatch(self, seconds: float) -> None:
+        self.histograms["dispatch_latency"].record(seconds)
+
+    def finish(self, now: float) -> None:
+        """Завершает замеры: время от ухода экзаменатора до конца экзамена считается простоем"""
+        for examiner, finished_at in self.finished_at.items():
+            self.examiner_idle(examiner, now - finished_at)
+        self.finished_at.clear()
+
+    def to_dict(self) -> dict:
+        """Возвращает замеры в виде словаря (для вывода в JSON)"""
+        return {
+            "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            "examiners": [
+                {"examiner": str(examiner), **{kind: round(value, 3) for kind, value in totals.items()}}
+                for examiner, totals in self.examiners.items()
+            ],
+        }
+
+    def get_histograms_table(self) -> 'Table':
+        """Создаёт таблицу с квантилями всех гистограмм"""
+        from . import presentation
+        return presentation.histograms_table(self)
+
+    def get_examiners_table(self) -> 'Table':
+        """Создаёт таблицу загрузки экзаменаторов"""
+        from . import presentation
+        return presentation.utilisation_table(self)
@@ -1,20 +1,105 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
 
-@dataclass(frozen=True)
+NAME_PATTERN = re.compile(r'[А-Яа-яA-Za-zёЁ\-]+')
+RUSSIAN_VOWELS = frozenset('аеёиоуыэюя')
+
+
+@dataclass(frozen=True, slots=True)
 class Person:
     """Класс для отображения человека"""
     first_name: str
     last_name: str
+    # Производные поля считаются один раз при создании
+    sex: str = field(init=False, repr=False, compare=False)
+    name_len: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Проверяет корректность данных после инициализации"""
-        if not self.first_name or not self.last_name:
-            raise ValueError("Имя и фамилия не могут быть пустыми")
+        error = self.validate(self.first_name, self.last_name)
+        if error:
+            raise ValueError(error)
+        self._set_derived()
+
+    def _set_derived(self) -> None:
+        """Заполняет производные поля (пол и длину имени)"""
+        object.__setattr__(self, 'sex', 'women' if self.ends_with_russian_vowel(self.first_name) else 'men')
+        object.__setattr__(self, 'name_len', len(self.first_name))
+
+    @staticmethod
+    def validate(first_name: str, last_name: str) -> str | None:
+        """Возвращает описание ошибки или None, если имя и фамилия корректны"""
+        if not first_name or not last_name:
+            return "Имя и фамилия не могут быть пустыми"
+        if not NAME_PATTERN.fullmatch(first_name) or not NAME_PATTERN.fullmatch(last_name):
+            return "Имя и фамилия должны содержать только буквы"
+        return None
+
+    @classmethod
+    def from_records(cls, records) -> tuple[list['Person'], list[tuple[int, object, str]]]:
+        """
+        Массово создаёт людей из записей [first_name, last_name] за один проход.
+        Не останавливается на первой ошибке: возвращает список людей и список
+        ошибок (номер записи с 1, запись, описание)
+        """
+        persons = []
+        errors = []
+        # Запись проверяется один раз, объект собирается напрямую через слоты, без __post_init__
+        fullmatch = NAME_PATTERN.fullmatch
+        make = cls.assembler()
+        for number, record in enumerate(records, start=1):
+            try:
+                first_name, last_name = record
+            except (TypeError, ValueError):
+                errors.append((number, record, "Запись должна состоять из имени и фамилии"))
+                continue
+            if not (first_name and last_name and fullmatch(first_name) and fullmatch(last_name)):
+                errors.append((number, record, cls.validate(first_name, last_name)))
+                continue
+            persons.append(make(first_name, last_name,
+                                'women' if first_name[-1].lower() in RUSSIAN_VOWELS else 'men'))
+        return persons, errors
 
-        if not re.match(r'^[А-Яа-яA-Za-zёЁ\-]+$', self.first_name) or \
-           not re.match(r'^[А-Яа-яA-Za-zёЁ\-]+$', self.last_name):
-            raise ValueError("Имя и фамилия должны содержать только буквы")
+    @classmethod
+    def build_all(cls, records) -> list['Person']:
+        """
+        Создаёт людей из записей [first_name, last_name] или выбрасывает исключение,
+        предварительно сообщив обо всех неверных записях сразу, а не только о первой
+        """
+        persons, errors = cls.from_records(records)
+        if errors:
+            for number, record, error in errors:
+                print(f"[ERROR] Ошибка создания Person (запись {number}: {record}): {error}")
+            raise ValueError(f"Неверных записей: {len(errors)}")
+        return persons
+
+    @classmethod
+    def assembler(cls):
+        """
+        Возвращает функцию make(first_name, last_name, sex), которая собирает
+        уже проверенного человека напрямую через слоты, без __post_init__
+        """
+        new = object.__new__
+        set_first, set_last = cls.first_name.__set__, cls.last_name.__set__
+        set_sex, set_name_len = cls.sex.__set__, cls.name_len.__set__
+
+        def make(first_name: str, last_name: str, sex: str) -> 'Person':
+            person = new(cls)
+            set_first(person, first_name)
+            set_last(person, last_name)
+            set_sex(person, sex)
+            set_name_len(person, len(first_name))
+            return person
+
+        return make
+
+    def __reduce__(self):
+        """Компактная сериализация (pickle): только имя и фамилия, производные поля пересчитываются"""
+        return self.__class__, (self.first_name, self.last_name)
+
+    def __deepcopy__(self, memo) -> 'Person':
+        """Человек неизменяем, поэтому копия состояния (copy.deepcopy) ссылается на тот же объект"""
+        return self
 
     def get_full_name(self) -> str:
         """Геттер"""
@@ -27,10 +112,4 @@ class Person:
     @staticmethod
     def ends_with_russian_vowel(s: str) -> bool:
         """Проверка последней гласной"""
-        vowels = {'а', 'е', 'ё', 'и', 'о', 'у', 'ы', 'э', 'ю', 'я'}
-        return s[-1].lower() in vowels
-
-    @property
-    def sex(self) -> str:
-        """Атрибут пола"""
-        return 'women' if self.ends_with_russian_vowel(self.first_name) else 'men'
+        return s[-1].lower() in RUSSIAN_VOWELS
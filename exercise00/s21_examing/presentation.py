@@ -0,0 +1,226 @@
+"""
+Отрисовка статистики экзамена средствами rich.
+Модуль загружается только при первой отрисовке, поэтому импорт s21_examing
+(рабочие процессы, режим --headless) обходится без rich
+"""
+import asyncio
+import contextlib
+import os
+import sys
+
+from rich.console import Console
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+
+console = Console()
+
+# Клавиши прокрутки таблицы студентов: (строк, страниц)
+SCROLL_KEYS = {
+    b'\x1b[A': (-1, 0), b'k': (-1, 0),
+    b'\x1b[B': (1, 0), b'j': (1, 0),
+    b'\x1b[5~': (0, -1), b'b': (0, -1),
+    b'\x1b[6~': (0, 1), b' ': (0, 1),
+    b'\x1b[H': (-sys.maxsize, 0), b'g': (-sys.maxsize, 0),
+    b'\x1b[F': (sys.maxsize, 0), b'G': (sys.maxsize, 0),
+}
+SCROLL_HINT = "↑/↓, PgUp/PgDn — прокрутка"
+
+
+def examiners_table(statistics) -> Table:
+    """Создаёт таблицу экзаменаторов с текущей статистикой"""
+    table = Table(title="Статистика экзаменаторов")
+    for title in statistics.EXAMINERS_INDICATORS_TITLES:
+        table.add_column(title)
+
+    for examiner, stats in statistics.examiners_stats.items():
+        row = [
+            str(examiner),
+            str(stats.current_student) if stats.current_student and not stats.on_lunch_break else "-",
+            str(stats.total_students),
+            str(stats.failed_students),
+            f"{stats.time_worked:.2f} сек"
+        ]
+        table.add_row(*row)
+
+    return table
+
+
+def students_table(statistics) -> Table:
+    """
+    Создаёт таблицу студентов с текущей статистикой.
+    Строится только видимое окно из students_page_size строк, начиная с students_offset
+    """
+    students = statistics.students_stats
+    visible = students.window(statistics.students_offset, statistics.students_page_size)
+    first_row = statistics.students_offset + 1 if visible else 0
+    scrollable = statistics.scroll_keys and len(students) > statistics.students_page_size
+    table = Table(
+        title=f"Статистика студентов ({SCROLL_HINT})" if scrollable else "Статистика студентов",
+        caption=f"{first_row}–{statistics.students_offset + len(visible)} из {len(students)}; "
+                f"{statistics.get_students_counts_text()}",
+        min_width=statistics.STUDENTS_TABLE_WIDTH
+    )
+    for title in statistics.STUDENT_INDICATORS_TITLES:
+        table.add_column(title)
+
+    for index in visible:
+        row = [
+            str(students.persons[index]),
+            statistics.STUDENT_STATUSES[students.status[index]]
+        ]
+        table.add_row(*row)
+
+    return table
+
+
+def final_table(statistics) -> Table:
+    """Создаёт итоговую таблицу экзаменаторов с текущей статистикой"""
+    table = Table(title="Итоговая статистика")
+    for title in statistics.FINAL_INDICATORS_TITLES:
+        table.add_column(title)
+
+    for examiner, stats in statistics.examiners_stats.items():
+        row = [
+            str(examiner),
+            str(stats.total_students),
+            str(stats.failed_students),
+            f"{stats.time_worked:.2f} сек"
+        ]
+        table.add_row(*row)
+
+    return table
+
+
+def layout(statistics) -> Panel:
+    """Возвращает панель из объектов библиотеки rich"""
+    exam_layout = Layout()
+    exam_layout.split(
+        Layout(name="students", renderable=students_table(statistics), size=statistics.STUDENTS_PANEL_SIZE),
+        Layout(name="examiners", renderable=examiners_table(statistics) if statistics.num_student_in_queue \
+            else final_table(statistics)),
+        Layout(name="footer", renderable=statistics.get_accompanying_info_text() if statistics.num_student_in_queue \
+            else statistics.get_summary_info_text()),
+
+    )
+    return Panel(exam_layout, title="📊 Экзамен", border_style="blue")
+
+
+async def update_both_tables(statistics, min_frame_interval=0.25) -> None:
+    """
+    Управляет обновлением информации о ходе экзамена при изменении состояния:
+    ждёт сигнала об изменении статистики и перерисовывает не чаще min_frame_interval
+    """
+    rendered_version = statistics.version
+
+    with scroll_keys(statistics), Live(layout(statistics), auto_refresh=False, console=console) as live:
+        while statistics.num_student_in_queue:
+            await statistics.changed.wait()
+            statistics.changed.clear()
+
+            if statistics.version != rendered_version:
+                rendered_version = statistics.version
+                live.update(layout(statistics), refresh=True)
+
+            await asyncio.sleep(min_frame_interval)
+
+        live.update(layout(statistics), refresh=True)
+
+
+def parse_scroll_keys(data: bytes, page_size: int) -> int:
+    """Возвращает, на сколько строк прокрутить таблицу по нажатым клавишам (неизвестные пропускаются)"""
+    rows = 0
+    position = 0
+    while position < len(data):
+        for key, (lines, pages) in SCROLL_KEYS.items():
+            if data.startswith(key, position):
+                rows = max(-sys.maxsize, min(sys.maxsize, rows + lines + pages * page_size))
+                position += len(key)
+                break
+        else:
+            position += 1
+    return rows
+
+
+@contextlib.contextmanager
+def scroll_keys(statistics):
+    """
+    Пока идёт экзамен, прокручивает таблицу студентов клавишами ↑/↓ (j/k), PgUp/PgDn (b/пробел),
+    Home/End (g/G). Нажатия читаются из терминала без эха и без Enter через цикл событий,
+    поэтому отрисовка не блокируется. Без терминала (или без termios) прокрутки нет
+    """
+    try:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        if not os.isatty(fd):
+            raise OSError
+        saved = termios.tcgetattr(fd)
+    except (ImportError, OSError, ValueError):
+        yield
+        return
+
+    def on_keys():
+        rows = parse_scroll_keys(os.read(fd, 64), statistics.students_page_size)
+        if rows:
+            statistics.scroll_students(rows)
+
+    loop = asyncio.get_running_loop()
+    tty.setcbreak(fd)
+    loop.add_reader(fd, on_keys)
+    statistics.scroll_keys = True
+    try:
+        yield
+    finally:
+        statistics.scroll_keys = False
+        loop.remove_reader(fd)
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def histograms_table(instrumentation) -> Table:
+    """Создаёт таблицу с квантилями всех гистограмм"""
+    table = Table(title="Замеры экзамена")
+    for title in ("Показатель", "Кол-во", "Среднее", "p50", "p90", "p99", "Макс."):
+        table.add_column(title)
+
+    for name, title in instrumentation.HISTOGRAMS.items():
+        histogram = instrumentation.histograms[name]
+        unit, scale = ("мкс", 1e6) if name == "dispatch_latency" else ("сек", 1.0)
+        values = (histogram.mean(), histogram.quantile(0.5), histogram.quantile(0.9),
+                  histogram.quantile(0.99), histogram.max)
+        table.add_row(title, str(histogram.count), *(f"{value * scale:.2f} {unit}" for value in values))
+
+    return table
+
+
+def utilisation_table(instrumentation) -> Table:
+    """Создаёт таблицу загрузки экзаменаторов"""
+    table = Table(title="Загрузка экзаменаторов")
+    for title in ("Экзаменатор", "Работа", "Простой", "Обед", "Загрузка"):
+        table.add_column(title)
+
+    for examiner, totals in instrumentation.examiners.items():
+        total = sum(totals.values())
+        utilisation = totals["busy"] / total if total else 0.0
+        table.add_row(str(examiner), *(f"{totals[kind]:.2f} сек" for kind in instrumentation.INTERVALS),
+                      f"{utilisation:.1%}")
+
+    return table
+
+
+def replicas_table(report) -> Table:
+    """Создаёт таблицу со средними и доверительными интервалами повторов экзамена"""
+    table = Table(title=f"Повторы экзамена: {report.replicas} (seed {report.seed})",
+                  caption="95% доверительный интервал среднего")
+    for title in ("Показатель", "Среднее", "95% ДИ"):
+        table.add_column(title)
+
+    for name, title in report.METRICS.items():
+        table.add_row(title, *report.format_interval(report.metrics[name], percent=name != "makespan"))
+    for name, share in report.best_examiners.items():
+        table.add_row(f"Лучший экзаменатор: {name}", f"{share:.1%}", "")
+    for question, interval in report.questions.items():
+        table.add_row(f"Верных ответов: {question}", *report.format_interval(interval, percent=True))
+
+    return table
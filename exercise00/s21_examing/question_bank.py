@@ -0,0 +1,73 @@
+import random
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import accumulate
+
+F_CONST = 1.618
+WEIGHTS_CACHE_SIZE = 1024
+
+
+def golden_weights(n: int, f_const: float = F_CONST) -> list:
+    """Возвращает список весов золотого сечения для вопроса из n слов"""
+    weights = []
+    total = 0.0
+
+    for i in range(n):
+        if i == 0:
+            weight = 1 / f_const
+        elif i == n - 1:
+            weight = 1 - total
+        else:
+            weight = (1 - total) / f_const
+
+        weights.append(weight)
+        total += weight
+
+    return weights
+
+
+@lru_cache(maxsize=WEIGHTS_CACHE_SIZE)
+def cumulative_weights(n: int, reverse: bool = False) -> tuple[float, ...]:
+    """Возвращает накопленные веса для вопроса из n слов (прямые или для развёрнутого списка)"""
+    weights = golden_weights(n)
+    if reverse:
+        weights.reverse()
+    return tuple(accumulate(weights))
+
+
+class QuestionBank(Sequence):
+    """Банк вопросов: каждый вопрос разбивается на слова один раз"""
+
+    def __init__(self, questions=()) -> None:
+        self._questions = []
+        self._tokens = {}
+        for question in questions:
+            self.add(question)
+
+    def add(self, question: str, tokens: tuple[str, ...] | None = None) -> None:
+        """Добавляет вопрос в банк, сохраняя его интернированные слова (или уже готовое разбиение)"""
+        self._questions.append(question)
+        if question not in self._tokens:
+            self._tokens[question] = tokens if tokens is not None else \
+                tuple(sys.intern(word) for word in question.split())
+
+    def tokens(self, question: str) -> tuple[str, ...]:
+        """Возвращает слова вопроса"""
+        tokens = self._tokens.get(question)
+        if tokens is None:
+            return tuple(question.split())
+        return tokens
+
+    def sample(self, number=3, rng=random) -> list:
+        """Возвращает несколько случайных вопросов без повторений"""
+        return rng.sample(self._questions, number)
+
+    def __getitem__(self, index):
+        return self._questions[index]
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __repr__(self) -> str:
+        return f"QuestionBank({self._questions!r})"
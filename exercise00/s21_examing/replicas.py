@@ -0,0 +1,140 @@
+import asyncio
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist, fmean, stdev
+from typing import TYPE_CHECKING
+
+from .clock import VirtualClock
+from .exam_manager import ExamManager
+from .scheduling import POLICIES
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Квантили t-распределения Стьюдента уровня 0.975 (двусторонний интервал 95%) по числу степеней свободы
+T_QUANTILES_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def t_quantile(df: int) -> float:
+    """Возвращает квантиль 0.975 t-распределения (берётся ближайшее меньшее число степеней свободы из таблицы)"""
+    if df > 120:
+        return NormalDist().inv_cdf(0.975)
+    return T_QUANTILES_95[max(key for key in T_QUANTILES_95 if key <= df)]
+
+
+def confidence_interval(values, bounds=(-math.inf, math.inf)) -> dict:
+    """Возвращает среднее и 95% доверительный интервал среднего (обрезанный до допустимых границ)"""
+    values = list(values)
+    mean = fmean(values) if values else 0.0
+    if len(values) < 2:
+        return {"mean": mean, "low": mean, "high": mean}
+    half_width = t_quantile(len(values) - 1) * stdev(values) / math.sqrt(len(values))
+    return {"mean": mean, "low": max(mean - half_width, bounds[0]), "high": min(mean + half_width, bounds[1])}
+
+
+class QuestionTally:
+    """Приёмник событий экзамена (как EventLog): считает, сколько раз вопрос задан и сколько раз отвечен верно"""
+
+    def __init__(self) -> None:
+        self.asked = Counter()
+        self.correct = Counter()
+
+    def emit(self, event: str, time: float, **fields) -> None:
+        if event == "question_answered":
+            self.asked[fields["question"]] += 1
+            self.correct[fields["question"]] += fields["correct"]
+
+
+def run_replica(examiners: list, students: list, questions, seed: str, policy='fifo') -> dict:
+    """
+    Моделирует один экзамен в виртуальном времени. Каждый экзаменатор получает
+    свой генератор из seed, поэтому повтор воспроизводим и не зависит от модуля random
+    """
+    tally = QuestionTally()
+    manager = ExamManager(examiners, students, questions, clock=VirtualClock(), policy=POLICIES[policy](),
+                          events=tally, seed=seed)
+    asyncio.run(manager.run_exam())
+
+    statistics = manager.statistics
+    return {
+        "pass_rate": 1 - statistics.failed_students / statistics.total_students if statistics.total_students else 0.0,
+        "success": float(statistics.get_exam_summary()),
+        "makespan": statistics.get_exam_time(),
+        "best_examiners": [str(examiner) for examiner in statistics.get_all_best_examiners()],
+        "questions": {question: tally.correct[question] / asked for question, asked in tally.asked.items()},
+    }
+
+
+class ReplicaReport:
+    """Сводка по повторам экзамена: средние и 95% доверительные интервалы"""
+    METRICS = {
+        "pass_rate": "Доля сдавших",
+        "success": "Экзамен удался (доля повторов)",
+        "makespan": "Время экзамена, сек",
+    }
+    SHARE = (0.0, 1.0)
+    BOUNDS = {"pass_rate": SHARE, "success": SHARE, "makespan": (0.0, math.inf)}
+
+    def __init__(self, results: list[dict], seed) -> None:
+        self.seed = seed
+        self.replicas = len(results)
+        self.metrics = {name: confidence_interval((result[name] for result in results), self.BOUNDS[name])
+                        for name in self.METRICS}
+        best = Counter(name for result in results for name in result["best_examiners"])
+        self.best_examiners = {name: count / self.replicas for name, count in best.most_common()}
+        # Вопрос, который ни разу не задали в повторе, в его среднем не участвует
+        questions = {}
+        for result in results:
+            for question, frequency in result["questions"].items():
+                questions.setdefault(question, []).append(frequency)
+        self.questions = {question: confidence_interval(values, self.SHARE) for question, values in questions.items()}
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "replicas": self.replicas,
+            "metrics": self.metrics,
+            "best_examiners": self.best_examiners,
+            "questions": self.questions,
+        }
+
+    @staticmethod
+    def format_interval(interval: dict, percent=False) -> tuple[str, str]:
+        if percent:
+            return f"{interval['mean']:.1%}", f"{interval['low']:.1%} … {interval['high']:.1%}"
+        return f"{interval['mean']:.2f}", f"{interval['low']:.2f} … {interval['high']:.2f}"
+
+    def get_table(self) -> 'Table':
+        """Создаёт таблицу со средними и доверительными интервалами"""
+        from . import presentation
+        return presentation.replicas_table(self)
+
+
+def run_replicas(examiners: list, students: list, questions, replicas: int, seed=None,
+                 workers=None, policy='fifo') -> ReplicaReport:
+    """
+    Запускает replicas независимых повторов экзамена с политикой policy по процессам.
+    Повтор номер i использует seed '<seed>:<i>' (а экзаменатор j в нём — '<seed>:<i>/<j>'),
+    поэтому результат не зависит от числа процессов. Без seed он выбирается случайно и попадает в отчёт
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    students = list(students)
+    examiners = list(examiners)
+    seeds = [f"{seed}:{replica}" for replica in range(replicas)]
+    workers = max(1, min(workers or os.cpu_count() or 1, replicas))
+
+    if workers == 1:
+        results = [run_replica(examiners, students, questions, replica_seed, policy) for replica_seed in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_replica, [examiners] * replicas, [students] * replicas,
+                                    [questions] * replicas, seeds, [policy] * replicas, chunksize=max(1, replicas // (workers * 4))))
+    return ReplicaReport(results, seed)
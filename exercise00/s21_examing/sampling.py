@@ -0,0 +1,87 @@
+import random
+from bisect import bisect
+from collections import deque
+
+from .question_bank import cumulative_weights
+
+
+class FenwickTree:
+    """
+    Дерево Фенвика над n позициями, изначально все позиции «живые».
+    Хранит только счётчики удалённых позиций, поэтому создаётся за O(1).
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.alive = size
+        self._removed = {}
+        self._top = 1 << size.bit_length() if size else 0
+
+    def remove(self, position: int) -> None:
+        """Помечает позицию (с нуля) удалённой"""
+        i = position + 1
+        while i <= self.size:
+            self._removed[i] = self._removed.get(i, 0) + 1
+            i += i & -i
+        self.alive -= 1
+
+    def find_kth(self, k: int) -> int:
+        """Возвращает позицию k-й (с нуля) живой позиции"""
+        position = 0
+        step = self._top
+        while step:
+            node = position + step
+            if node <= self.size:
+                alive_in_node = (node & -node) - self._removed.get(node, 0)
+                if alive_in_node <= k:
+                    position = node
+                    k -= alive_in_node
+            step >>= 1
+        return position
+
+
+class WordSampler:
+    """
+    Выбор слов вопроса без возвращения с весами золотого сечения.
+    Вес слова зависит только от его места среди оставшихся слов, поэтому
+    разыгрывается номер по таблице накопленных весов полной длины (хвост
+    таблицы сливается в последнее слово), а слово находится по номеру
+    в дереве Фенвика. Выбор и удаление — O(log n) вместо пересчёта весов
+    и list.remove на каждом шаге.
+    """
+
+    def __init__(self, words: list, rng=random) -> None:
+        self.words = words
+        self.rng = rng
+        self._tree = FenwickTree(len(words))
+        self._cum_weights = cumulative_weights(len(words)) if words else ()
+        self._positions = None  # слово -> очередь позиций его оставшихся вхождений
+
+    def __len__(self) -> int:
+        return self._tree.alive
+
+    def draw(self) -> str | None:
+        """Возвращает случайное слово из оставшихся"""
+        remaining = self._tree.alive
+        if not remaining:
+            return None
+        cum_weights = self._cum_weights
+        n = len(cum_weights)
+        rank = bisect(cum_weights, self.rng.random() * cum_weights[-1], 0, n - 1)
+        return self.words[self._tree.find_kth(min(rank, remaining - 1))]
+
+    def remove(self, word: str) -> None:
+        """
+        Удаляет первое из оставшихся вхождений слова (как list.remove) за O(log n).
+        Вхождения одного слова удаляются по порядку, поэтому позиции слов
+        собираются один раз (при первом удалении) и берутся из начала очереди.
+        Выбрасывает ValueError, если оставшихся вхождений нет.
+        """
+        if self._positions is None:
+            self._positions = {}
+            for position, item in enumerate(self.words):
+                self._positions.setdefault(item, deque()).append(position)
+        positions = self._positions.get(word)
+        if not positions:
+            raise ValueError(f"{word!r} нет среди оставшихся слов")
+        self._tree.remove(positions.popleft())
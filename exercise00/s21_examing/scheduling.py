@@ -0,0 +1,90 @@
+import heapq
+
+from .person import Person
+
+LUNCH_AFTER = 30.0
+LUNCH_MEAN = 15.0
+LUNCH_MAX = 18.0
+
+
+def expected_exam_time(examiner: Person) -> float:
+    """Ожидаемая длительность экзамена у экзаменатора (середина диапазона длина имени ±1)"""
+    return float(examiner.name_len)
+
+
+class SchedulingPolicy:
+    """
+    Политика распределения студентов (по умолчанию FIFO):
+    любой освободившийся экзаменатор берёт следующего студента из очереди
+    """
+    name = 'fifo'
+
+    def plan(self, examiners, num_students: int) -> None:
+        """Готовит распределение перед началом экзамена"""
+
+    def take(self, examiner: Person, forecast=None) -> bool:
+        """
+        Решает, может ли экзаменатор взять ещё одного студента. Отказ окончателен:
+        экзаменатор заканчивает работу. forecast() возвращает фактическое состояние экзамена
+        (см. ExamManager.forecast) для политик, которым оно нужно
+        """
+        return True
+
+
+class EarliestFinishPolicy(SchedulingPolicy):
+    """
+    Онлайн-раздача по раннему окончанию. Студенты одинаковы, а длительность зависит
+    от экзаменатора, поэтому FIFO уже отдаёт каждого студента тому, кто освободился первым,
+    и проигрывает только в конце: последних студентов могут забрать медленные экзаменаторы.
+    Освободившийся экзаменатор отказывается от студента (и заканчивает работу), если по прогнозу
+    остальные примут всю оставшуюся очередь раньше, чем он закончит одного студента.
+    Прогноз строится по фактическому состоянию: когда освободится каждый экзаменатор,
+    сколько он отработал и был ли у него обед (обед — в среднем 15 с после 30 с работы).
+    Заранее рассчитанные квоты (LPT) так не умеют: длительности случайны (±1 с),
+    и квоты заставляют ждать одних экзаменаторов, пока другие стоят без дела
+    """
+    name = 'earliest-finish'
+
+    def __init__(self) -> None:
+        self.fastest = 0.0
+        self.slowest = 0.0
+
+    def plan(self, examiners, num_students: int) -> None:
+        durations = [expected_exam_time(examiner) for examiner in examiners]
+        self.fastest = min(durations, default=0.0)
+        self.slowest = max(durations, default=0.0)
+
+    def take(self, examiner: Person, forecast=None) -> bool:
+        if forecast is None or self.fastest <= 0:
+            return True
+        now, waiting, others = forecast()
+        deadline = now + expected_exam_time(examiner)
+        # Пока очередь длиннее, чем остальные могут принять до deadline, считать нечего
+        rounds = int((deadline - now + self.slowest + LUNCH_MAX) / self.fastest) + 1
+        if waiting > len(others) * rounds:
+            return True
+
+        # Жадно раздаём очередь остальным (каждого студента — тому, кто раньше закончит)
+        heap = [self.advance(free, worked, lunched, duration) for free, worked, lunched, duration in others]
+        heapq.heapify(heap)
+        for _ in range(waiting):
+            if not heap:
+                return True
+            finish, worked, lunched, duration = heapq.heappop(heap)
+            if finish > deadline:
+                return True
+            heapq.heappush(heap, self.advance(finish, worked, lunched, duration))
+        return False
+
+    @staticmethod
+    def advance(free: float, worked: float, lunched: bool, duration: float) -> tuple:
+        """
+        Прогноз для экзаменатора, освобождающегося в момент free: когда он закончит
+        следующего студента, его время работы, был ли обед, длительность экзамена
+        """
+        if worked >= LUNCH_AFTER and not lunched:
+            free, lunched = free + LUNCH_MEAN, True
+        return free + duration, worked + duration, lunched, duration
+
+
+POLICIES = {policy.name: policy for policy in (SchedulingPolicy, EarliestFinishPolicy)}
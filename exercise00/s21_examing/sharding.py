@@ -0,0 +1,53 @@
+import asyncio
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+from .clock import VirtualClock
+from .exam_manager import ExamManager
+from .exam_statistics import ExamStatistics
+from .scheduling import POLICIES
+
+
+def partition(items, shards: int) -> list[list]:
+    """Делит список на shards частей по кругу (размеры частей отличаются не более чем на 1)"""
+    items = list(items)
+    return [items[shard::shards] for shard in range(shards)]
+
+
+def run_shard(examiners: list, students: list, questions, seed=None, policy='fifo') -> ExamStatistics:
+    """Моделирует одну часть экзамена в виртуальном времени и возвращает её статистику"""
+    if seed is not None:
+        random.seed(seed)
+    manager = ExamManager(examiners, students, questions, clock=VirtualClock(), policy=POLICIES[policy]())
+    asyncio.run(manager.run_exam())
+    return manager.statistics
+
+
+def run_sharded(examiners: list, students: list, questions, shards=None, seed=None,
+                policy='fifo') -> ExamStatistics:
+    """
+    Делит очереди студентов и экзаменаторов на shards частей, моделирует каждую часть
+    в отдельном процессе с политикой policy и объединяет статистику через ExamStatistics.merge.
+    Каждый экзаменатор попадает ровно в одну часть (иначе его обеды и время работы
+    посчитались бы несколько раз), поэтому частей не больше, чем экзаменаторов
+    """
+    shards = shards or os.cpu_count() or 1
+    students = list(students)
+    examiners = list(examiners)
+    if len(examiners) < shards:
+        print(f"[warn] Экзаменаторов меньше, чем частей: экзамен делится на {max(1, len(examiners))}")
+    shards = max(1, min(shards, len(students) or 1, len(examiners) or 1))
+
+    student_parts = partition(students, shards)
+    examiner_parts = partition(examiners, shards)
+    seeds = [None if seed is None else seed + shard for shard in range(shards)]
+
+    if shards == 1:
+        return run_shard(examiner_parts[0], student_parts[0], questions, seeds[0], policy)
+
+    with ProcessPoolExecutor(max_workers=shards) as pool:
+        results = list(pool.map(run_shard, examiner_parts, student_parts, [questions] * shards, seeds,
+                                [policy] * shards))
+    return reduce(ExamStatistics.merge, results)
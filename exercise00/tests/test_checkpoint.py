@@ -0,0 +1,55 @@
+import asyncio
+
+from s21_examing import ExamManager, VirtualClock
+from s21_examing.checkpoint import Checkpointer
+
+EXAMINERS = [("Иван", "Петров"), ("Мария", "Сидорова"), ("Олег", "Ким"), ("Анна", "Ли")]
+STUDENTS = [("Ан" + "а" * (number % 5) + "я", "Ф" + "б" * number) for number in range(300)]
+QUESTIONS = [f"слово{number} вопрос" for number in range(10)]
+
+
+class FirstCheckpoint(Checkpointer):
+    """Делает единственный снимок — после первого итога, пока экзамен только начался"""
+
+    def due(self) -> bool:
+        return self.saved == 0
+
+
+def run(manager) -> dict:
+    asyncio.run(manager.run_exam())
+    return manager.statistics.get_summary_info()
+
+
+def test_resume_from_early_checkpoint_reproduces_exam(tmp_path):
+    path = str(tmp_path / "exam.ckpt")
+    manager = ExamManager(EXAMINERS, STUDENTS, QUESTIONS, clock=VirtualClock(), seed=5,
+                          checkpoint=FirstCheckpoint(path))
+    # Снимок пишется в потоке, пока экзамен продолжается: в файл не должны попасть более поздние изменения
+    expected = run(manager)
+
+    resumed = ExamManager.from_checkpoint(path, clock=VirtualClock())
+    assert resumed.dispatcher.snapshot()
+    assert run(resumed) == expected
+
+
+def test_state_is_not_changed_by_exam_progress():
+    manager = ExamManager(EXAMINERS, STUDENTS, QUESTIONS, clock=VirtualClock(), seed=5)
+    state = manager.get_state()
+    pending = list(state['students'])
+    run(manager)
+
+    assert state['students'] == pending
+    assert state['statistics'].num_student_in_queue == len(STUDENTS)
+    assert len(state['statistics'].students_stats.buckets[0]) == len(STUDENTS)
+    assert not state['in_progress'] and not state['lunched']
+
+
+def test_examiners_with_the_same_name_finish_the_exam(tmp_path):
+    path = str(tmp_path / "exam.ckpt")
+    examiners = [("Иван", "П"), ("Иван", "П")]
+    manager = ExamManager(examiners, STUDENTS[:60], QUESTIONS, clock=VirtualClock(), seed=5,
+                          checkpoint=FirstCheckpoint(path))
+    expected = run(manager)
+
+    assert len(manager.statistics.students_stats.buckets[0]) == 0
+    assert run(ExamManager.from_checkpoint(path, clock=VirtualClock())) == expected
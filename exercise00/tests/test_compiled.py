@@ -0,0 +1,39 @@
+import pytest
+
+from s21_examing import FileReader
+from s21_examing.compiled import COMPILED_VERSION, compile_persons, compiled_path
+
+ROSTER = "Иван Петров\nМария Сидорова\n"
+
+
+@pytest.fixture
+def students(tmp_path):
+    path = tmp_path / "students.txt"
+    path.write_text(ROSTER, encoding="UTF-8")
+    compile_persons(str(path), FileReader(str(path), use_compiled=False).read_persons())
+    return path
+
+
+def test_compiled_file_is_used(students):
+    assert [str(person) for person in FileReader(str(students)).load_persons()] == ["Иван", "Мария"]
+
+
+@pytest.mark.parametrize("damage", ["empty", "version", "truncated"])
+def test_unreadable_compiled_file_falls_back_to_text(students, damage, capsys):
+    binary = compiled_path(str(students))
+    with open(binary, "r+b") as file:
+        data = bytearray(file.read())
+        if damage == "empty":
+            data.clear()
+        elif damage == "version":
+            data[6] = COMPILED_VERSION + 1  # байт версии сразу за 6-байтовой сигнатурой
+        else:
+            del data[20:]
+        file.seek(0)
+        file.truncate()
+        file.write(data)
+
+    persons = FileReader(str(students)).load_persons()
+
+    assert [str(person) for person in persons] == ["Иван", "Мария"]
+    assert "[warn]" in capsys.readouterr().out
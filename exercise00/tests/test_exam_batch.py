@@ -0,0 +1,51 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from s21_examing.exam import Exam
+from s21_examing.exam_batch import check_answers_batch
+from s21_examing.person import Person
+
+TRIALS = 20_000
+QUESTIONS = ["один", "два слова", "что такое дерево Фенвика", "a b a c b a d"]
+MAN, WOMAN = Person("Иван", "Петров"), Person("Анна", "Сидорова")
+PAIRS = [(MAN, MAN), (MAN, WOMAN), (WOMAN, MAN), (WOMAN, WOMAN)]
+
+
+def exam_pass_rate(examiner: Person, student: Person, question: str, seed: int) -> float:
+    rng = random.Random(seed)
+    return sum(Exam(examiner, student, question, rng=rng).check_answer() for _ in range(TRIALS)) / TRIALS
+
+
+def batch_pass_rate(examiner: Person, student: Person, question: str, seed: int) -> float:
+    passed = check_answers_batch([examiner] * TRIALS, [student] * TRIALS, [question] * TRIALS,
+                                 rng=np.random.default_rng(seed))
+    return float(passed.mean())
+
+
+@pytest.mark.parametrize("question", QUESTIONS)
+@pytest.mark.parametrize("examiner, student", PAIRS, ids=["mm", "mw", "wm", "ww"])
+def test_batch_pass_rate_matches_exam(examiner, student, question):
+    # Двухвыборочный z-тест долей: при фиксированных seed тест детерминирован,
+    # порог 4 сигмы ловит смещение вероятности сдачи примерно на 2 п.п. и больше
+    expected = exam_pass_rate(examiner, student, question, seed=7)
+    actual = batch_pass_rate(examiner, student, question, seed=7)
+    pooled = (expected + actual) / 2
+    sigma = math.sqrt(2 * pooled * (1 - pooled) / TRIALS) or 1e-12
+    assert abs(actual - expected) / sigma < 4, (expected, actual)
+
+
+def test_batch_accepts_masks_and_mixed_questions():
+    rng = np.random.default_rng(0)
+    examiners = np.array([False, True, False])
+    students = np.array([True, True, False])
+    passed = check_answers_batch(examiners, students, ["один", ["a", "b"], "x y z"], rng=rng)
+    assert passed.dtype == np.bool_ and passed.shape == (3,)
+    assert passed[0]  # единственное слово всегда совпадает
+
+
+def test_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        check_answers_batch([MAN], [MAN, WOMAN], ["один"])
@@ -0,0 +1,47 @@
+import random
+
+from s21_examing.exam_statistics import ExamStatistics, StudentColumns
+from s21_examing.person import Person
+from s21_examing.presentation import parse_scroll_keys
+
+
+def make_person(number: int) -> Person:
+    return Person("Иван", "Петров" + "а" * number)
+
+
+def test_window_matches_status_order_after_random_changes():
+    rng = random.Random(9)
+    columns = StudentColumns()
+    statuses = []
+    for number in range(200):
+        columns.add(make_person(number))
+        statuses.append(ExamStatistics.STATUS_QUEUE)
+    for step in range(3000):
+        index = rng.randrange(len(statuses))
+        status = rng.randrange(len(ExamStatistics.STUDENT_STATUSES))
+        columns.set_status(index, status)
+        statuses[index] = status
+        if step % 50 == 0:  # студенты добавляются и во время экзамена
+            columns.add(make_person(len(statuses)))
+            statuses.append(ExamStatistics.STATUS_QUEUE)
+
+    expected = [index for status in range(len(ExamStatistics.STUDENT_STATUSES))
+                for index, value in enumerate(statuses) if value == status]
+    assert [len(bucket) for bucket in columns.buckets] == \
+        [statuses.count(status) for status in range(len(ExamStatistics.STUDENT_STATUSES))]
+    for offset in range(0, len(expected) + 2, 3):
+        for limit in (1, 7, 40):
+            assert columns.window(offset, limit) == expected[offset:offset + limit]
+
+
+def test_scroll_students_is_clamped():
+    statistics = ExamStatistics([make_person(number) for number in range(20)])
+    page = statistics.students_page_size
+    statistics.scroll_students(parse_scroll_keys(b'\x1b[6~', page))
+    assert statistics.students_offset == page
+    statistics.scroll_students(parse_scroll_keys(b'kk', page))
+    assert statistics.students_offset == page - 2
+    statistics.scroll_students(parse_scroll_keys(b'G', page))
+    assert statistics.students_offset == 20 - page
+    statistics.scroll_students(parse_scroll_keys(b'\x1b[A?g', page))
+    assert statistics.students_offset == 0
@@ -0,0 +1,107 @@
+import random
+from collections import Counter
+
+import pytest
+
+from s21_examing.exam import Exam
+from s21_examing.person import Person
+from s21_examing.question_bank import golden_weights
+from s21_examing.sampling import FenwickTree, WordSampler
+
+QUESTIONS = [
+    "один",
+    "два слова",
+    "что такое дерево Фенвика",
+    "a b a c b a d",
+    "раз два три четыре пять шесть семь восемь девять десять одиннадцать двенадцать",
+]
+# Критические значения хи-квадрат для уровня 0.001 по числу степеней свободы
+CHI2_CRITICAL_0_001 = {1: 10.83, 2: 13.82, 3: 16.27, 4: 18.47, 5: 20.52, 6: 22.46}
+
+
+def old_examiner_answer(words: list, rng: random.Random) -> list:
+    """Прежний алгоритм: веса пересчитываются по оставшимся словам, слово удаляется через list.remove"""
+    words = list(words)
+    answer = [rng.choices(words, weights=golden_weights(len(words)), k=1)[0]]
+    while words:
+        if rng.random() < 2 / 3:
+            break
+        words.remove(answer[-1])
+        if words:
+            answer.append(rng.choices(words, weights=golden_weights(len(words)), k=1)[0])
+    return answer
+
+
+def chi_square(observed: Counter, probabilities: dict, total: int) -> float:
+    return sum((observed[key] - total * p) ** 2 / (total * p) for key, p in probabilities.items())
+
+
+@pytest.mark.parametrize("question", QUESTIONS)
+def test_examiner_answers_match_list_remove_under_fixed_seed(question):
+    examiner, student = Person("Иван", "Петров"), Person("Анна", "Сидорова")
+    for seed in range(2000):
+        old = old_examiner_answer(question.split(), random.Random(seed))
+        new = Exam(examiner, student, question, rng=random.Random(seed)).get_examiner_answer()
+        assert new == old, f"seed {seed}"
+
+
+@pytest.mark.parametrize("n", [2, 3, 5, 7])
+def test_first_draw_follows_golden_weights(n):
+    words = [f"w{i}" for i in range(n)]
+    rng = random.Random(21)
+    total = 50_000
+    observed = Counter(WordSampler(words, rng).draw() for _ in range(total))
+    probabilities = dict(zip(words, golden_weights(n)))
+    assert chi_square(observed, probabilities, total) < CHI2_CRITICAL_0_001[n - 1]
+
+
+def test_draws_after_removal_follow_weights_of_remaining_words():
+    # После удаления слова веса считаются по его месту среди оставшихся, как у пересчитанного списка
+    words = ["a", "b", "c", "d", "e"]
+    rng = random.Random(4)
+    total = 50_000
+    observed = Counter()
+    for _ in range(total):
+        sampler = WordSampler(words, rng)
+        sampler.remove("b")
+        observed[sampler.draw()] += 1
+    probabilities = dict(zip(["a", "c", "d", "e"], golden_weights(4)))
+    assert observed["b"] == 0
+    assert chi_square(observed, probabilities, total) < CHI2_CRITICAL_0_001[3]
+
+
+def test_sampling_is_without_replacement():
+    words = "a b a c b a".split()
+    sampler = WordSampler(words, random.Random(0))
+    remaining = list(words)
+    while sampler:
+        word = sampler.draw()
+        assert word in remaining
+        sampler.remove(word)
+        remaining.remove(word)
+        assert len(sampler) == len(remaining)
+    assert sampler.draw() is None
+
+
+def test_fenwick_tree_finds_alive_positions():
+    tree = FenwickTree(10)
+    removed = {0, 3, 4, 9}
+    for position in removed:
+        tree.remove(position)
+    alive = [position for position in range(10) if position not in removed]
+    assert [tree.find_kth(k) for k in range(tree.alive)] == alive
+
+
+def test_remove_matches_list_remove_with_repeated_words():
+    rng = random.Random(4)
+    words = [rng.choice("абвгд") for _ in range(300)]
+    sampler = WordSampler(words)
+    remaining = list(words)
+    for _ in range(250):
+        word = rng.choice(remaining)
+        sampler.remove(word)
+        remaining.remove(word)
+        assert len(sampler) == len(remaining)
+    assert [words[sampler._tree.find_kth(k)] for k in range(len(sampler))] == remaining
+    with pytest.raises(ValueError):
+        sampler.remove("я")
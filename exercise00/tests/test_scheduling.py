@@ -0,0 +1,40 @@
+import asyncio
+
+from s21_examing import ExamManager, VirtualClock
+from s21_examing.person import Person
+from s21_examing.scheduling import EarliestFinishPolicy, SchedulingPolicy
+
+FAST = Person("Ян", "Ли")
+SLOW = Person("Александра", "Ли")
+
+
+def make_policy() -> EarliestFinishPolicy:
+    policy = EarliestFinishPolicy()
+    policy.plan([FAST, SLOW], 0)
+    return policy
+
+
+def test_slow_examiner_leaves_last_students_to_faster_one():
+    # Быстрый освободится через 1 с и примет двоих к 5 с, медленный закончил бы одного к 10 с
+    assert not make_policy().take(SLOW, lambda: (0.0, 2, [(1.0, 0.0, False, 2.0)]))
+
+
+def test_slow_examiner_takes_student_while_queue_is_long():
+    assert make_policy().take(SLOW, lambda: (0.0, 6, [(1.0, 0.0, False, 2.0)]))
+    # Обед быстрого (после 30 с работы) отодвигает его окончание за срок медленного
+    assert make_policy().take(SLOW, lambda: (0.0, 1, [(1.0, 30.0, False, 2.0)]))
+
+
+def test_earliest_finish_is_not_slower_than_fifo():
+    examiners = [("Ян", "Ли"), ("Ева", "Ли"), ("Александра", "Ли"), ("Константин", "Ли")]
+    students = [("Ан" + "а" * (number % 5) + "я", "Ф" + "б" * number) for number in range(60)]
+    questions = [f"слово{number} вопрос" for number in range(10)]
+
+    def makespan(policy) -> float:
+        clock = VirtualClock()
+        manager = ExamManager(examiners, students, questions, clock=clock, policy=policy, seed=3)
+        asyncio.run(manager.run_exam())
+        assert manager.statistics.total_students == len(students)
+        return clock.now()
+
+    assert makespan(EarliestFinishPolicy()) < makespan(SchedulingPolicy())
@@ -0,0 +1,18 @@
+from s21_examing.sharding import run_shard, run_sharded
+
+EXAMINERS = [("Иван", "Петров"), ("Мария", "Сидорова")]
+STUDENTS = [("Ан" + "а" * (number % 5) + "я", "Ф" + "б" * number) for number in range(40)]
+QUESTIONS = [f"слово{number} вопрос" for number in range(10)]
+
+
+def test_examiners_are_not_duplicated_across_shards():
+    statistics = run_sharded(EXAMINERS, STUDENTS, QUESTIONS, shards=4, seed=1, policy='earliest-finish')
+
+    # Частей не больше, чем экзаменаторов: каждый экзаменатор работает в одной части
+    assert sum(stats.total_students for stats in statistics.examiners_stats.values()) == len(STUDENTS)
+    expected = run_shard(EXAMINERS[:1], STUDENTS[::2], QUESTIONS, seed=1, policy='earliest-finish')
+    stats, = expected.examiners_stats.values()
+    merged = next(record for examiner, record in statistics.examiners_stats.items()
+                  if examiner.first_name == "Иван")
+    assert merged.time_worked == stats.time_worked
+    assert merged.total_students == stats.total_students
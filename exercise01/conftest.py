@@ -0,0 +1 @@
+# Каталог exercise01 попадает в sys.path, поэтому тесты импортируют модули загрузчика напрямую
@@ -0,0 +1,140 @@
+import asyncio
+import contextlib
+import json
+import os
+import shutil
+import threading
+
+
+class DownloadCache:
+    """
+    Локальный кэш загрузок с адресацией по содержимому.
+    Файлы хранятся в objects/<первые 2 символа sha256>/<sha256>, индекс (index.json)
+    связывает ссылку с хэшем содержимого и заголовками ETag/Last-Modified,
+    по которым при повторной загрузке отправляется условный запрос.
+    Одинаковые ссылки в одном запуске скачиваются один раз
+    """
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory) -> None:
+        self.directory = directory
+        self.index_path = os.path.join(directory, self.INDEX_NAME)
+        self.index = {}
+        self.inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def load(self) -> None:
+        """Создаёт папку кэша и читает индекс (повреждённый индекс считается пустым)"""
+        os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+        try:
+            with open(self.index_path, encoding="UTF-8") as file:
+                self.index = json.load(file)
+        except FileNotFoundError:
+            self.index = {}
+        except (OSError, ValueError) as e:
+            print(f"[warn] Индекс кэша '{self.index_path}' не прочитан ({e}) — кэш начинается заново")
+            self.index = {}
+
+    def save(self) -> None:
+        """Атомарно записывает индекс"""
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="UTF-8") as file:
+            json.dump(self.index, file, ensure_ascii=False)
+        os.replace(temp_path, self.index_path)
+
+    def object_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "objects", sha256[:2], sha256)
+
+    def lookup(self, url: str) -> dict | None:
+        """Возвращает запись индекса для ссылки, если файл в кэше на месте"""
+        entry = self.index.get(url)
+        if entry is not None and os.path.exists(self.object_path(entry["sha256"])):
+            return entry
+        return None
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        """Заголовки условного запроса по сохранённым ETag и Last-Modified"""
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store_object(self, path: str, sha256: str) -> None:
+        """Кладёт копию скачанного файла в кэш, если такого содержимого ещё нет (выполняется в потоке)"""
+        object_path = self.object_path(sha256)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            copy_file(path, object_path)
+
+    def record(self, url: str, sha256: str, size: int, response_headers) -> None:
+        """Обновляет индекс; вызывается только из цикла событий, где индекс и читается"""
+        self.index[url] = {
+            "sha256": sha256,
+            "size": size,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+
+    def restore(self, entry: dict, path: str) -> None:
+        """Достаёт копию файла из кэша в папку загрузок"""
+        copy_file(self.object_path(entry["sha256"]), path)
+
+    def hit(self, size: int) -> None:
+        self.hits += 1
+        self.bytes_saved += size
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    def claim(self, url: str) -> asyncio.Future | None:
+        """
+        Одинаковые ссылки в одном запуске скачиваются один раз: первая загрузка получает None
+        и должна вызвать release, повторные получают future с путём к сохранённому файлу
+        (None, если первая загрузка не удалась)
+        """
+        first = self.inflight.get(url)
+        if first is None:
+            self.inflight[url] = asyncio.get_running_loop().create_future()
+        return first
+
+    def release(self, url: str, saved_path: str | None) -> None:
+        """Сообщает повторным загрузкам ссылки результат первой"""
+        future = self.inflight[url]
+        if not future.done():
+            future.set_result(saved_path)
+
+    def get_summary_text(self) -> str:
+        """Строка со счётчиками кэша для итоговой таблицы"""
+        return (f"Кэш: попаданий {self.hits}, промахов {self.misses}, "
+                f"сэкономлено {format_size(self.bytes_saved)}")
+
+
+def copy_file(source: str, target: str) -> None:
+    """
+    Копирует файл, атомарно заменяя target. Именно копия, а не жёсткая ссылка:
+    правка загруженного изображения не должна менять объект в кэше
+    """
+    # Имя временного файла своё у каждого потока: одно содержимое могут копировать параллельно
+    temp_path = f"{target}.{threading.get_ident()}.tmp"
+    try:
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+
+def format_size(size: float) -> str:
+    """Размер в байтах в удобных единицах"""
+    for unit in ("Б", "КиБ", "МиБ"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "Б" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} ГиБ"
@@ -0,0 +1,97 @@
+"""
+Локальный сервер для проверки докачки: отдаёт /img/<n> (случайные байты с ETag),
+первые --errors раз для каждой ссылки отвечает 503, а следующие --drops раз
+обрывает соединение посреди тела. Поддерживает Range и If-Range (отключается --no-range).
+
+Запуск из каталога exercise01:
+    python flaky_server.py --size 5000000 --drop-after 1000000 --drops 2
+    printf 'http://127.0.0.1:8080/img/1\\n' | python main.py --path /tmp/images --no-cache
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import re
+from collections import Counter
+
+from aiohttp import web
+
+RANGE = re.compile(r"bytes=(\d+)-")
+# Пауза перед обрывом: иначе клиент получит ошибку раньше уже пришедших байт (aiohttp отдаёт
+# исключение соединения до остатка буфера) и докачивать будет нечего
+DROP_DELAY = 0.05
+# Журнал ответов приложения: (путь, статус, начальный байт)
+REQUESTS = web.AppKey("requests", list)
+
+
+def make_body(size: int, n: str, seed=0) -> bytes:
+    """Тело ссылки /img/<n>"""
+    return random.Random(f"{seed}/{n}").randbytes(size)
+
+
+def make_app(size: int, drop_after: int, drops: int, ranges=True, seed=0, errors=0) -> web.Application:
+    """
+    Создаёт приложение; тело каждой ссылки и его ETag детерминированы seed и номером.
+    В app[REQUESTS] записываются путь, статус и начальный байт каждого ответа
+    """
+    dropped = Counter()
+    failed = Counter()
+    log = []
+
+    async def image(request):
+        if failed[request.path] < errors:
+            failed[request.path] += 1
+            log.append((request.path, 503, None))
+            return web.Response(status=503)
+
+        body = make_body(size, request.match_info["n"], seed)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        start = 0
+        match = RANGE.fullmatch(request.headers.get("Range", ""))
+        if ranges and match and request.headers.get("If-Range", etag) == etag:
+            start = int(match.group(1))
+            if start >= size:
+                log.append((request.path, 416, start))
+                return web.Response(status=416, headers={"Content-Range": f"bytes */{size}"})
+        log.append((request.path, 206 if start else 200, start))
+
+        headers = {"ETag": etag, "Content-Length": str(size - start)}
+        if ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if start:
+            headers["Content-Range"] = f"bytes {start}-{size - 1}/{size}"
+        response = web.StreamResponse(status=206 if start else 200, headers=headers)
+        await response.prepare(request)
+
+        if dropped[request.path] < drops and size - start > drop_after:
+            dropped[request.path] += 1
+            await response.write(body[start:start + drop_after])
+            await asyncio.sleep(DROP_DELAY)
+            request.transport.close()
+            return response
+        await response.write(body[start:])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app[REQUESTS] = log
+    app.router.add_get("/img/{n}", image)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--size", type=int, default=5_000_000, help="размер файла, байт")
+    parser.add_argument("--drop-after", type=int, default=1_000_000, help="сколько байт отдать до обрыва")
+    parser.add_argument("--drops", type=int, default=2, help="сколько раз оборвать каждую ссылку")
+    parser.add_argument("--errors", type=int, default=0, help="сколько раз ответить 503 на каждую ссылку")
+    parser.add_argument("--no-range", action="store_true", help="не поддерживать Range")
+    args = parser.parse_args()
+
+    web.run_app(make_app(args.size, args.drop_after, args.drops, not args.no_range, errors=args.errors),
+                host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
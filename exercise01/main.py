@@ -1,73 +1,305 @@
+import argparse
 import asyncio
 import aiohttp
+import contextlib
+import functools
+import hashlib
 import os
+import random
+import stat
+import sys
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
+from download_cache import DownloadCache, copy_file
+from metrics import DownloadMetrics, live_metrics
+from partial_download import PartialDownload
+
 console = Console()
 prompt = Prompt(console=console)
 
+# Потолок памяти на одну загрузку: тело читается кусками по CHUNK_SIZE,
+# буфер aiohttp ограничен тем же размером (read_bufsize), а следующий кусок
+# читается только после записи предыдущего
+CHUNK_SIZE = 64 * 1024
+# Одновременных загрузок всего и соединений с одним хостом
+CONCURRENCY = 32
+PER_HOST = 8
+# Повторов после сетевой ошибки или ответа 5xx; задержка перед ними (сек) удваивается до BACKOFF_MAX
+RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 10.0
+# Папка кэша по умолчанию (внутри папки загрузок)
+CACHE_DIRNAME = ".image_cache"
+# Сколько байт строк читать из обычного файла ссылок за одно обращение к потоку
+URL_BATCH_BYTES = 64 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Асинхронная загрузка изображений")
+    parser.add_argument("--urls", metavar="PATH",
+                        help="файл со ссылками, по одной на строку ('-' — stdin); "
+                             "если stdin — не терминал, ссылки читаются из него")
+    parser.add_argument("--path", help="папка для сохранения (без вопроса пользователю)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="одновременных загрузок")
+    parser.add_argument("--per-host", type=int, default=PER_HOST, help="соединений с одним хостом")
+    parser.add_argument("--retries", type=int, default=RETRIES, help="повторов при сетевой ошибке")
+    parser.add_argument("--cache", metavar="DIR",
+                        help=f"папка кэша загрузок (по умолчанию <папка загрузок>/{CACHE_DIRNAME})")
+    parser.add_argument("--no-cache", action="store_true", help="скачивать всё заново, без кэша")
+    parser.add_argument("--metrics", metavar="PATH", help="сохранить замеры загрузок в JSON при выходе")
+    return parser.parse_args()
 
-async def download_image(session, url, filename, path, table):
-    """Скачивает изображение и сохраняет в указанной директории"""
+
+async def download_image(session, url, filename, path, table, cache=None, retries=RETRIES, metrics=None):
+    """
+    Скачивает изображение и сохраняет в указанной директории.
+    С кэшем повтор ссылки в том же запуске не скачивается, а копируется с первой загрузки
+    """
+    full_path = os.path.join(path, os.path.basename(filename))
     status = "Ошибка"
+    record = metrics.start(url) if metrics is not None else None
+    first = cache.claim(url) if cache is not None else None
     try:
-        async with session.get(url) as response:
-            if response.status == 200:
-                full_path = os.path.join(path, os.path.basename(filename))
-                data = await response.read()
-                with open(full_path, "wb") as f:
-                    f.write(data)
-                console.print(f"[green]Сохранено: {full_path}[/]")
-                status = "Успех"
-            else:
-                console.print(f"[red]Ошибка загрузки {url}: статус {response.status}[/]")
-            await update_downloads_table(table, url, status)
+        if first is not None:
+            status = await copy_duplicate(first, url, full_path, cache)
+        else:
+            status = await fetch_image(session, url, full_path, cache, retries, record)
     except Exception as e:
         console.print(f"[red]Ошибка при загрузке {url}: {e}[/]")
-        await update_downloads_table(table, url, status)
+    finally:
+        if cache is not None and first is None:
+            cache.release(url, full_path if status != "Ошибка" else None)
+        if record is not None:
+            record.finish(status)
+    await update_downloads_table(table, url, status)
 
 
-async def get_urls_and_start_downloads(session, path, table):
-    """Читает ссылки от пользователя и запускает загрузку"""
-    tasks = []
-    counter = 1
+async def fetch_image(session, url, full_path, cache=None, retries=RETRIES, record=None) -> str:
+    """
+    Запрашивает изображение и возвращает статус загрузки.
+    Сетевые ошибки и ответы 5xx повторяются до retries раз с экспоненциальной задержкой;
+    недокачанный файл между попытками (и между запусками) сохраняется и докачивается
+    """
+    partial = PartialDownload(url, os.path.dirname(full_path))
+    # Без кэша одинаковые ссылки не объединяются: их загрузки по очереди пользуются одним .part
+    async with partial.lock():
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = backoff_delay(attempt)
+                console.print(f"[yellow]Повтор {attempt}/{retries} для {url} через {delay:.1f} сек[/]")
+                await asyncio.sleep(delay)
+            try:
+                return await fetch_once(session, url, full_path, partial, cache, record)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == retries:
+                    raise
+                console.print(f"[yellow]Ошибка при загрузке {url}: {e or type(e).__name__}[/]")
+
+
+def backoff_delay(attempt: int) -> float:
+    """Задержка перед попыткой attempt: удваивается с каждой попыткой, со случайным разбросом"""
+    delay = min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+async def fetch_once(session, url, full_path, partial, cache=None, record=None) -> str:
+    """
+    Одна попытка загрузки. Если ссылка есть в кэше, запрос условный: на 304 тело
+    не передаётся, файл берётся из кэша. Иначе, если есть недокачанный файл,
+    запрашивается только недостающий диапазон
+    """
+    entry = cache.lookup(url) if cache is not None else None
+    if entry is not None:
+        offset = 0
+        headers = DownloadCache.conditional_headers(entry)
+    else:
+        offset = await asyncio.to_thread(partial.load)
+        headers = partial.range_headers(offset)
+
+    async with session.get(url, headers=headers) as response:
+        if record is not None:
+            record.response_started()
+        if response.status == 304 and entry is not None:
+            await asyncio.to_thread(cache.restore, entry, full_path)
+            cache.hit(entry["size"])
+            console.print(f"[green]Из кэша: {full_path}[/]")
+            return "Из кэша"
+        if response.status == 206 and offset and partial.accepts(response, offset):
+            console.print(f"[blue]Докачиваем {url} с {offset} байт[/]")
+        elif response.status == 200:
+            # Сервер не поддерживает диапазоны или файл изменился — качаем заново
+            offset = 0
+        elif response.status in (206, 416):
+            # Ответ не продолжает недокачанный файл: он больше не годится, следующая попытка — целиком
+            await asyncio.to_thread(partial.discard)
+            raise aiohttp.ClientResponseError(response.request_info, response.history, status=response.status,
+                                              message="диапазон не продолжает недокачанный файл")
+        elif response.status >= 500:
+            response.raise_for_status()
+        else:
+            console.print(f"[red]Ошибка загрузки {url}: статус {response.status}[/]")
+            return "Ошибка"
+
+        size, sha256 = await save_response(response, full_path, partial, offset, record)
+        if cache is not None:
+            await asyncio.to_thread(cache.store_object, full_path, sha256)
+            cache.record(url, sha256, size, response.headers)
+            cache.miss()
+        console.print(f"[green]Сохранено: {full_path}[/]")
+        return "Успех"
 
+
+async def copy_duplicate(first, url, full_path, cache) -> str:
+    """Дожидается первой загрузки той же ссылки и копирует её файл"""
+    saved_path = await first
+    if saved_path is None:
+        console.print(f"[red]Ошибка загрузки {url}: первая загрузка этой ссылки не удалась[/]")
+        return "Ошибка"
+    await asyncio.to_thread(copy_file, saved_path, full_path)
+    cache.hit(os.path.getsize(full_path))
+    console.print(f"[green]Дубликат: {full_path}[/]")
+    return "Дубликат"
+
+
+async def save_response(response, full_path, partial, offset=0, record=None) -> tuple[int, str]:
+    """
+    Потоково сохраняет тело ответа: куски пишутся в .part-файл в пуле потоков,
+    по окончании файл атомарно переименовывается. При offset тело дописывается
+    к уже скачанным байтам. Если принято не столько байт, сколько объявил сервер
+    (для несжатого тела), это ошибка передачи (её повторяют). При ошибке .part остаётся для докачки,
+    если её можно проверить по ETag/Last-Modified, иначе удаляется.
+    Возвращает размер и sha256 всего содержимого (хэш считается в том же потоке, что и запись)
+    """
+    digest = hashlib.sha256()
+    if offset:
+        await asyncio.to_thread(hash_file, partial.path, digest)
+    await asyncio.to_thread(partial.begin, response, offset)
+    size = offset
+    try:
+        f = await asyncio.to_thread(open, partial.path, "ab" if offset else "wb", buffering=0)
+        with f:
+            def write(chunk):
+                f.write(chunk)
+                digest.update(chunk)
+
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                await asyncio.to_thread(write, chunk)
+                size += len(chunk)
+                if record is not None:
+                    record.bytes += len(chunk)
+        if partial.length is not None and size != partial.length:
+            raise aiohttp.ClientPayloadError(f"принято {size} байт из {partial.length}")
+        await asyncio.to_thread(partial.finish, full_path)
+        return size, digest.hexdigest()
+    except BaseException:
+        if not partial.resumable:
+            partial.discard()
+        raise
+
+
+def hash_file(path, digest) -> None:
+    """Добавляет в digest содержимое файла (уже скачанную часть)"""
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            digest.update(chunk)
+
+
+async def prompt_urls():
+    """Спрашивает ссылки у пользователя, не блокируя цикл событий (input выполняется в потоке)"""
     while True:
-        url = input(f"Введите ссылку на изображение (или Enter, чтобы закончить): ").strip()
+        url = await asyncio.to_thread(input, "Введите ссылку на изображение (или Enter, чтобы закончить): ")
+        url = url.strip()
         if not url:
-            return tasks
+            return
+        yield url
 
+
+def is_regular_file(file) -> bool:
+    """Обычный ли это файл (а не канал или терминал): чтение из него не ждёт новых данных"""
+    try:
+        return stat.S_ISREG(os.fstat(file.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+async def read_urls(file):
+    """
+    Потоково читает ссылки из файла или канала в потоке, пустые строки пропускаются.
+    Обычный файл читается пачками строк; из канала — по строке, чтобы ссылка
+    шла в загрузку сразу, а не после того, как наберётся пачка
+    """
+    if is_regular_file(file):
+        read = functools.partial(file.readlines, URL_BATCH_BYTES)
+    else:
+        def read():
+            line = file.readline()
+            return [line] if line else []
+
+    while True:
+        lines = await asyncio.to_thread(read)
+        if not lines:
+            return
+        for line in lines:
+            url = line.strip()
+            if url:
+                yield url
+
+
+async def get_urls_and_start_downloads(session, path, table, urls, concurrency=CONCURRENCY, cache=None,
+                                       retries=RETRIES, metrics=None):
+    """
+    Запускает загрузку по ссылкам из асинхронного источника.
+    Одновременно выполняется не больше concurrency загрузок: следующая ссылка
+    берётся, только когда освобождается место, поэтому задачи не копятся
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = set()
+    counter = 1
+
+    async for url in urls:
+        await semaphore.acquire()
         filename = f"image_{counter}.jpg"
-        task = asyncio.create_task(download_image(session, url, filename, path, table))
-        tasks.append(task)
+        task = asyncio.create_task(download_image(session, url, filename, path, table, cache, retries,
+                                                   metrics))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(lambda _: semaphore.release())
         counter += 1
 
+    return tasks
+
+
+def check_download_path(path) -> bool:
+    """Создаёт папку при необходимости и проверяет, что в неё можно писать"""
+    # Проверяем, существует ли путь
+    if not os.path.exists(path):
+        try:
+            os.makedirs(path)
+            console.print(f"[green]Создана новая директория: {path}[/]")
+        except Exception as e:
+            console.print(f"[red]Невозможно создать путь: {e}[/]")
+            return False
+
+    # Проверяем доступ на запись
+    test_file = os.path.join(path, ".write_test")
+    try:
+        with open(test_file, "w") as f:
+            f.write("test")
+        os.remove(test_file)
+        return True
+    except (PermissionError, OSError) as e:
+        console.print(f"[red]Нет прав на запись в эту папку: {e}[/]")
+        return False
+
 
 async def get_valid_download_path():
     """Запрашивает у пользователя путь до папки, где будут сохранены изображения"""
     while True:
         path = prompt.ask("[bold blue]Введите путь для сохранения изображений", default=os.getcwd())
-
-        # Проверяем, существует ли путь
-        if not os.path.exists(path):
-            try:
-                os.makedirs(path)
-                console.print(f"[green]Создана новая директория: {path}[/]")
-            except Exception as e:
-                console.print(f"[red]Невозможно создать путь: {e}[/]")
-                continue
-
-        # Проверяем доступ на запись
-        test_file = os.path.join(path, ".write_test")
-        try:
-            with open(test_file, "w") as f:
-                f.write("test")
-            os.remove(test_file)
+        if check_download_path(path):
             return path
-        except (PermissionError, OSError) as e:
-            console.print(f"[red]Нет прав на запись в эту папку: {e}[/]")
 
 
 def get_downloads_table() -> Table:
@@ -85,18 +317,62 @@ async def update_downloads_table(table, url, status):
 
 
 async def main():
-    path = await get_valid_download_path()
+    args = parse_args()
+    if args.urls is None and not sys.stdin.isatty():
+        args.urls = "-"
+    batch = args.urls is not None
+
+    if args.path is not None or batch:
+        # В пакетном режиме stdin может быть занят ссылками, поэтому папку не спрашиваем
+        path = args.path if args.path is not None else os.getcwd()
+        if not check_download_path(path):
+            return
+    else:
+        path = await get_valid_download_path()
+
+    cache = None
+    if not args.no_cache:
+        cache = DownloadCache(args.cache if args.cache is not None else os.path.join(path, CACHE_DIRNAME))
+        cache.load()
+
     table = get_downloads_table()
-    async with aiohttp.ClientSession() as session:
-        # Параллельно читаем ввод и запускаем загрузки
-        tasks = await get_urls_and_start_downloads(session, path, table)
-
-        # Ждём завершения всех загрузок
-        if tasks:
-            console.print("[blue]Загружаем последние файлы...[/]")
-            await asyncio.gather(*tasks)
-        console.print("[bold green]Все загрузки завершены.[/]")
-        console.print(table)
+    metrics = DownloadMetrics()
+    connector = aiohttp.TCPConnector(limit=args.concurrency, limit_per_host=args.per_host)
+    try:
+        async with aiohttp.ClientSession(connector=connector, read_bufsize=CHUNK_SIZE) as session:
+            # В пакетном режиме замеры обновляются на экране во время загрузки;
+            # при вводе ссылок вручную живая таблица мешала бы вопросу, поэтому она выводится в конце
+            async with live_metrics(metrics, console) if batch else contextlib.nullcontext():
+                # Ссылки читаются, пока уже запущенные загрузки идут
+                if not batch:
+                    tasks = await get_urls_and_start_downloads(session, path, table, prompt_urls(),
+                                                               args.concurrency, cache, args.retries, metrics)
+                elif args.urls == "-":
+                    tasks = await get_urls_and_start_downloads(session, path, table, read_urls(sys.stdin),
+                                                               args.concurrency, cache, args.retries, metrics)
+                else:
+                    with open(args.urls, encoding="UTF-8") as file:
+                        tasks = await get_urls_and_start_downloads(session, path, table, read_urls(file),
+                                                                   args.concurrency, cache, args.retries, metrics)
+
+                # Ждём завершения всех загрузок
+                if tasks:
+                    console.print("[blue]Загружаем последние файлы...[/]")
+                    await asyncio.gather(*tasks)
+                metrics.finish()
+            console.print("[bold green]Все загрузки завершены.[/]")
+            if cache is not None:
+                table.caption = cache.get_summary_text()
+            console.print(table)
+            if not batch:
+                console.print(metrics.get_table())
+    finally:
+        # Индекс и замеры сохраняются и при прерывании: уже положенные в кэш файлы не пропадут
+        if cache is not None:
+            await asyncio.to_thread(cache.save)
+        if args.metrics is not None:
+            metrics.finish()
+            await asyncio.to_thread(metrics.save, args.metrics)
 
 
 if __name__ == "__main__":
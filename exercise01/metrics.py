@@ -0,0 +1,203 @@
+import asyncio
+import bisect
+import contextlib
+import json
+import math
+import time
+from collections import Counter, deque
+
+from rich.live import Live
+from rich.table import Table
+
+from download_cache import format_size
+
+
+def percentile(ordered: list, q: float) -> float | None:
+    """Квантиль q отсортированного списка по методу ближайшего ранга (None для пустого списка)"""
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class DownloadRecord:
+    """
+    Замеры одной загрузки: время до первого ответа сервера (TTFB), общее время
+    с учётом повторов, принятые по сети байты и скорость
+    """
+    __slots__ = ("url", "status", "started", "first_byte", "finished", "bytes", "metrics")
+
+    def __init__(self, url: str, metrics=None) -> None:
+        self.url = url
+        self.metrics = metrics
+        self.status = "Загрузка"
+        self.started = time.perf_counter()
+        self.first_byte = None
+        self.finished = None
+        self.bytes = 0
+
+    def response_started(self) -> None:
+        """Отмечает получение заголовков первого ответа"""
+        if self.first_byte is None:
+            self.first_byte = time.perf_counter()
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.record_finished(self)
+
+    @property
+    def ttfb(self) -> float | None:
+        return self.first_byte - self.started if self.first_byte is not None else None
+
+    @property
+    def latency(self) -> float:
+        """Время загрузки (для незавершённой — на текущий момент)"""
+        return (self.finished if self.finished is not None else time.perf_counter()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Байт в секунду"""
+        latency = self.latency
+        return self.bytes / latency if latency > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "ttfb": self.ttfb,
+            "latency": self.latency,
+            "bytes": self.bytes,
+            "throughput": self.throughput,
+        }
+
+
+class DownloadMetrics:
+    """
+    Замеры всех загрузок запуска: по каждой загрузке и сводные (скорость, квантили задержек).
+    Сводка поддерживается по мере завершения загрузок (задержки лежат в отсортированных списках),
+    поэтому перерисовка живой таблицы не проходит по всем загрузкам
+    """
+    QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+    # Сколько загрузок показывать в живой таблице: сначала текущие, затем последние завершённые
+    TABLE_ROWS = 15
+    # Загрузки, тело которых пришло по сети: только их время загрузки попадает в квантили.
+    # Дубликаты копируются локально, а ответ 304 («Из кэша») тела не содержит
+    NETWORK_STATUSES = ("Успех",)
+
+    def __init__(self) -> None:
+        self.records = []
+        self.active = {}
+        self.recent = deque(maxlen=self.TABLE_ROWS)
+        self.statuses = Counter()
+        self.latencies = []
+        self.ttfbs = []
+        self.finished_bytes = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def start(self, url: str) -> DownloadRecord:
+        record = DownloadRecord(url, self)
+        self.records.append(record)
+        self.active[record] = None
+        return record
+
+    def record_finished(self, record: DownloadRecord) -> None:
+        """Учитывает завершённую загрузку в сводке"""
+        del self.active[record]
+        self.recent.append(record)
+        self.statuses[record.status] += 1
+        self.finished_bytes += record.bytes
+        if record.ttfb is not None:
+            bisect.insort(self.ttfbs, record.ttfb)
+        if record.status in self.NETWORK_STATUSES:
+            bisect.insort(self.latencies, record.latency)
+
+    def finish(self) -> None:
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished if self.finished is not None else time.perf_counter()) - self.started
+
+    def get_quantiles(self, ordered: list) -> dict:
+        return {name: percentile(ordered, q) for name, q in self.QUANTILES.items()}
+
+    def get_summary(self) -> dict:
+        """
+        Сводные показатели: скорость считается по всему времени запуска, TTFB — по завершённым запросам,
+        время загрузки — только по загрузкам с телом из сети; дубликаты и ответы из кэша считаются отдельно
+        """
+        transferred = self.finished_bytes + sum(record.bytes for record in self.active)
+        elapsed = self.elapsed
+        return {
+            "downloads": len(self.records),
+            "active": len(self.active),
+            "failed": self.statuses["Ошибка"],
+            "cached": self.statuses["Из кэша"],
+            "duplicates": self.statuses["Дубликат"],
+            "bytes": transferred,
+            "elapsed": elapsed,
+            "throughput": transferred / elapsed if elapsed > 0 else 0.0,
+            "ttfb": self.get_quantiles(self.ttfbs),
+            "latency": self.get_quantiles(self.latencies),
+        }
+
+    def to_dict(self) -> dict:
+        return {"summary": self.get_summary(), "downloads": [record.to_dict() for record in self.records]}
+
+    def save(self, path) -> None:
+        with open(path, "w", encoding="UTF-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+
+    def get_summary_text(self) -> str:
+        """Строка со сводными показателями для подписи таблицы"""
+        summary = self.get_summary()
+        latency = ", ".join(f"{name} {format_seconds(value)}" for name, value in summary["latency"].items())
+        ttfb = ", ".join(f"{name} {format_seconds(value)}" for name, value in summary["ttfb"].items())
+        return (f"Загрузок: {summary['downloads']} (идёт {summary['active']}, ошибок {summary['failed']}, "
+                f"из кэша {summary['cached']}, дубликатов {summary['duplicates']}); "
+                f"принято {format_size(summary['bytes'])} за {summary['elapsed']:.1f} сек, "
+                f"{format_size(summary['throughput'])}/с\n"
+                f"Время загрузки (по сети): {latency}\nTTFB: {ttfb}")
+
+    def get_table(self) -> Table:
+        """Создаёт таблицу замеров: текущие загрузки, последние завершённые и сводка в подписи"""
+        visible = list(self.active)[:self.TABLE_ROWS]
+        visible.extend(list(self.recent)[::-1][:self.TABLE_ROWS - len(visible)])
+
+        table = Table(title="Замеры загрузок", caption=self.get_summary_text())
+        for title in ("Ссылка", "Статус", "TTFB", "Время", "Принято", "Скорость"):
+            table.add_column(title)
+        for record in visible:
+            table.add_row(record.url, record.status, format_seconds(record.ttfb), format_seconds(record.latency),
+                          format_size(record.bytes), f"{format_size(record.throughput)}/с")
+
+        return table
+
+
+def format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value * 1000:.0f} мс" if value < 1 else f"{value:.2f} сек"
+
+
+async def update_metrics_table(metrics, live, interval=0.25) -> None:
+    """Перерисовывает живую таблицу замеров каждые interval секунд, пока задачу не отменят"""
+    while True:
+        live.update(metrics.get_table(), refresh=True)
+        await asyncio.sleep(interval)
+
+
+@contextlib.asynccontextmanager
+async def live_metrics(metrics, console, interval=0.25):
+    """Показывает живую таблицу замеров, пока выполняется блок; по выходу в ней остаются итоговые замеры"""
+    with Live(metrics.get_table(), console=console, auto_refresh=False) as live:
+        refresher = asyncio.create_task(update_metrics_table(metrics, live, interval))
+        try:
+            yield live
+        finally:
+            refresher.cancel()
+            metrics.finish()
+            live.update(metrics.get_table(), refresh=True)
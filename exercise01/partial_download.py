@@ -0,0 +1,139 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import weakref
+
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+# Блокировки .part-файлов: одну ссылку (при --no-cache) могут качать несколько задач сразу
+LOCKS = weakref.WeakValueDictionary()
+
+
+def get_validator(etag: str | None, last_modified: str | None) -> str | None:
+    """
+    Возвращает значение для If-Range: сильный ETag, а без него — Last-Modified.
+    Слабый ETag (W/...) для If-Range не годится
+    """
+    if etag and not etag.startswith("W/"):
+        return etag
+    return last_modified or None
+
+
+def is_encoded(response) -> bool:
+    """
+    Сжато ли тело (Content-Encoding): aiohttp распаковывает его на лету, поэтому
+    размеры из заголовков не совпадают с принятыми байтами, а диапазоны к ним неприменимы
+    """
+    return response.headers.get("Content-Encoding", "identity").lower() != "identity"
+
+
+def get_length(response, offset: int) -> int | None:
+    """Полный размер файла по Content-Range (для 206) или Content-Length; None, если сервер его не сообщил"""
+    match = CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+    if match is not None and match.group(3) != "*":
+        return int(match.group(3))
+    length = response.headers.get("Content-Length")
+    return int(length) + offset if length is not None else None
+
+
+class PartialDownload:
+    """
+    Недокачанный файл .<хэш ссылки>.part в папке загрузок и рядом метаданные
+    .<хэш ссылки>.part.json (ссылка, ETag, Last-Modified, полный размер).
+    Имя зависит только от ссылки, а не от её места в списке, поэтому докачка
+    переживает перезапуск с другим списком ссылок.
+    Повторная загрузка продолжается запросом Range с If-Range: если файл на сервере
+    изменился или сервер не умеет отдавать диапазоны, он пришлёт файл целиком.
+    Сжатые (Content-Encoding) ответы не докачиваются: .part хранит уже распакованные байты
+    """
+
+    def __init__(self, url: str, directory) -> None:
+        self.url = url
+        key = hashlib.sha256(url.encode("UTF-8")).hexdigest()[:32]
+        self.path = os.path.join(directory, f".{key}.part")
+        self.meta_path = f"{self.path}.json"
+        self.validator = None
+        self.resumable = False
+        self.length = None
+
+    def lock(self) -> asyncio.Lock:
+        """Блокировка .part-файла: одновременные загрузки одной ссылки в одну папку идут по очереди"""
+        lock = LOCKS.get(self.path)
+        if lock is None:
+            lock = LOCKS[self.path] = asyncio.Lock()
+        return lock
+
+    def load(self) -> int:
+        """Возвращает, сколько байт ссылки уже скачано (0, если продолжать нечего)"""
+        try:
+            with open(self.meta_path, encoding="UTF-8") as file:
+                meta = json.load(file)
+            size = os.path.getsize(self.path)
+        except (OSError, ValueError):
+            self.discard()
+            return 0
+
+        validator = get_validator(meta.get("etag"), meta.get("last_modified"))
+        length = meta.get("length")
+        if meta.get("url") != self.url or validator is None or (length is not None and size > length):
+            self.discard()
+            return 0
+        self.validator = validator
+        self.resumable = True
+        self.length = length
+        return size
+
+    def range_headers(self, offset: int) -> dict:
+        """Заголовки запроса продолжения с байта offset"""
+        if not offset or self.validator is None:
+            return {}
+        # Диапазон считается по несжатому файлу, поэтому сжатие не разрешается
+        return {"Range": f"bytes={offset}-", "If-Range": self.validator, "Accept-Encoding": "identity"}
+
+    def accepts(self, response, offset: int) -> bool:
+        """Проверяет, что ответ 206 продолжает именно наш файл с байта offset"""
+        match = CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+        validator = get_validator(response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return (match is not None and int(match.group(1)) == offset and validator == self.validator
+                and not is_encoded(response))
+
+    def begin(self, response, offset: int) -> None:
+        """
+        Запоминает ожидаемый полный размер и записывает метаданные перед приёмом тела.
+        Без ETag/Last-Modified продолжать загрузку нельзя (не с чем сверить файл),
+        как и для сжатого тела (размер распакованного файла неизвестен), такой .part при ошибке удаляется
+        """
+        encoded = is_encoded(response)
+        length = None if encoded else get_length(response, offset)
+        # Продолжение без заголовков размера сверяется с размером из метаданных
+        self.length = length if length is not None or not offset else self.length
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        self.validator = get_validator(etag, last_modified)
+        self.resumable = self.validator is not None and not encoded
+        if not self.resumable:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.meta_path)
+            return
+
+        temp_path = f"{self.meta_path}.tmp"
+        with open(temp_path, "w", encoding="UTF-8") as file:
+            json.dump({"url": self.url, "etag": etag, "last_modified": last_modified, "length": self.length}, file)
+        os.replace(temp_path, self.meta_path)
+
+    def finish(self, full_path) -> None:
+        """Переименовывает докачанный файл и удаляет метаданные"""
+        os.replace(self.path, full_path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.meta_path)
+
+    def discard(self) -> None:
+        """Удаляет недокачанный файл и метаданные"""
+        for path in (self.path, self.meta_path):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        self.validator = None
+        self.resumable = False
+        self.length = None
@@ -0,0 +1,53 @@
+import random
+
+from metrics import DownloadMetrics, percentile
+
+STATUSES = ("Успех", "Успех", "Из кэша", "Дубликат", "Ошибка")
+
+
+def test_incremental_summary_matches_records():
+    rng = random.Random(3)
+    metrics = DownloadMetrics()
+    records = []
+    for number in range(200):
+        record = metrics.start(f"http://example.com/{number}")
+        if rng.random() < 0.8:
+            record.first_byte = record.started + rng.uniform(0.01, 0.2)
+        record.bytes = rng.randrange(1000)
+        records.append(record)
+    for record in records[:150]:
+        record.finish(rng.choice(STATUSES))
+
+    summary = metrics.get_summary()
+    done = records[:150]
+    assert summary["active"] == 50
+    assert summary["cached"] == sum(record.status == "Из кэша" for record in done)
+    assert summary["duplicates"] == sum(record.status == "Дубликат" for record in done)
+    assert summary["failed"] == sum(record.status == "Ошибка" for record in done)
+    assert summary["bytes"] == sum(record.bytes for record in records)
+    expected_ttfb = sorted(record.ttfb for record in done if record.ttfb is not None)
+    expected_latency = sorted(record.latency for record in done if record.status == "Успех")
+    assert summary["latency"] == {name: percentile(expected_latency, q)
+                                  for name, q in DownloadMetrics.QUANTILES.items()}
+    assert summary["ttfb"] == {name: percentile(expected_ttfb, q) for name, q in DownloadMetrics.QUANTILES.items()}
+
+
+def test_latency_ignores_duplicates_and_cache_hits():
+    metrics = DownloadMetrics()
+    for status in ("Успех", "Дубликат", "Из кэша", "Дубликат"):
+        metrics.start("http://example.com/1").finish(status)
+
+    assert len(metrics.latencies) == 1
+    assert metrics.get_summary()["latency"]["p99"] == metrics.latencies[0]
+
+
+def test_table_shows_active_then_recent():
+    metrics = DownloadMetrics()
+    records = [metrics.start(f"http://example.com/{number}") for number in range(40)]
+    for record in records[:30]:
+        record.finish("Успех")
+
+    table = metrics.get_table()
+    urls = list(table.columns[0].cells)
+    assert urls[:10] == [record.url for record in records[30:]]
+    assert urls[10:] == [record.url for record in records[29:24:-1]]
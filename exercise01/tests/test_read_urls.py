@@ -0,0 +1,32 @@
+import asyncio
+import os
+
+import main
+
+
+def test_pipe_yields_each_url_before_eof():
+    async def run():
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, encoding="UTF-8") as reader, os.fdopen(write_fd, "w", encoding="UTF-8") as writer:
+            urls = main.read_urls(reader)
+            writer.write("http://example.com/1\n\n")
+            writer.flush()
+            # Канал ещё открыт: первая ссылка должна прийти, не дожидаясь пачки или конца ввода
+            first = await asyncio.wait_for(anext(urls), timeout=2)
+            writer.write("http://example.com/2\n")
+            writer.close()
+            rest = [url async for url in urls]
+        return [first] + rest
+
+    assert asyncio.run(run()) == ["http://example.com/1", "http://example.com/2"]
+
+
+def test_regular_file_skips_blank_lines(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_text("a\n\n  \nb\n", encoding="UTF-8")
+
+    async def run():
+        with open(path, encoding="UTF-8") as file:
+            return [url async for url in main.read_urls(file)]
+
+    assert asyncio.run(run()) == ["a", "b"]
@@ -0,0 +1,123 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import main
+from flaky_server import REQUESTS, make_app, make_body
+
+SIZE = 300_000
+DROP_AFTER = 100_000
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(main, "BACKOFF_BASE", 0.0)
+
+
+def fetch(app, tmp_path, retries, paths=("/img/1",)):
+    """
+    Скачивает ссылки с тестового сервера через fetch_image по очереди в один и тот же файл;
+    возвращает статус последней загрузки и журнал сервера
+    """
+    async def run():
+        async with TestServer(app) as server:
+            async with aiohttp.ClientSession() as session:
+                for number, path in enumerate(paths, 1):
+                    try:
+                        status = await main.fetch_image(session, str(server.make_url(path)),
+                                                        str(tmp_path / "image.jpg"), retries=retries)
+                    except aiohttp.ClientError:
+                        if number == len(paths):
+                            raise
+                return status
+
+    return asyncio.run(run()), app[REQUESTS]
+
+
+def test_resumes_after_drops_with_range(tmp_path):
+    status, log = fetch(make_app(SIZE, DROP_AFTER, drops=2), tmp_path, retries=2)
+
+    assert status == "Успех"
+    assert (tmp_path / "image.jpg").read_bytes() == make_body(SIZE, "1")
+    assert [code for _, code, _ in log] == [200, 206, 206]
+    starts = [start for _, _, start in log]
+    assert 0 == starts[0] < starts[1] < starts[2]
+    assert not list(tmp_path.glob(".*.part*"))
+
+
+def test_refetches_in_full_without_range(tmp_path):
+    status, log = fetch(make_app(SIZE, DROP_AFTER, drops=1, ranges=False), tmp_path, retries=1)
+
+    assert status == "Успех"
+    assert (tmp_path / "image.jpg").read_bytes() == make_body(SIZE, "1")
+    assert [(code, start) for _, code, start in log] == [(200, 0), (200, 0)]
+
+
+def test_retries_server_errors_then_fails(tmp_path):
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        fetch(make_app(SIZE, DROP_AFTER, drops=0, errors=10), tmp_path, retries=3)
+
+    assert error.value.status == 503
+    assert not (tmp_path / "image.jpg").exists()
+
+
+def test_retries_server_errors_then_succeeds(tmp_path):
+    app = make_app(SIZE, DROP_AFTER, drops=0, errors=3)
+    status, log = fetch(app, tmp_path, retries=3)
+
+    assert status == "Успех"
+    assert [code for _, code, _ in log] == [503, 503, 503, 200]
+    assert (tmp_path / "image.jpg").read_bytes() == make_body(SIZE, "1")
+
+
+def test_partial_survives_other_url_at_same_position(tmp_path):
+    # Как три запуска без повторов, где на месте image.jpg по очереди /img/1 (обрыв), /img/2 (обрыв)
+    # и снова /img/1: недокачанный /img/1 не должен пропасть из-за /img/2
+    app = make_app(SIZE, DROP_AFTER, drops=1)
+    status, log = fetch(app, tmp_path, retries=0, paths=("/img/1", "/img/2", "/img/1"))
+
+    assert status == "Успех"
+    assert [(path, code) for path, code, _ in log] == [("/img/1", 200), ("/img/2", 200), ("/img/1", 206)]
+    assert (tmp_path / "image.jpg").read_bytes() == make_body(SIZE, "1")
+
+
+def test_duplicate_urls_without_cache(tmp_path):
+    app = make_app(SIZE, DROP_AFTER, drops=1)
+
+    async def run():
+        async with TestServer(app) as server:
+            async with aiohttp.ClientSession() as session:
+                async def urls():
+                    for _ in range(3):
+                        yield str(server.make_url("/img/1"))
+
+                table = main.get_downloads_table()
+                tasks = await main.get_urls_and_start_downloads(session, str(tmp_path), table, urls(),
+                                                                cache=None, retries=2)
+                await asyncio.gather(*tasks)
+                return list(table.columns[1].cells)
+
+    assert asyncio.run(run()) == ["Успех"] * 3
+    for number in (1, 2, 3):
+        assert (tmp_path / f"image_{number}.jpg").read_bytes() == make_body(SIZE, "1")
+    assert not list(tmp_path.glob(".*.part*"))
+
+
+def test_gzip_body_is_saved_decoded(tmp_path):
+    body = make_body(SIZE, "1")
+
+    async def image(request):
+        response = web.Response(body=body, headers={"ETag": '"gzip"'})
+        response.enable_compression(web.ContentCoding.gzip)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/img/1", image)
+    app[REQUESTS] = []
+    status, _ = fetch(app, tmp_path, retries=0)
+
+    assert status == "Успех"
+    assert (tmp_path / "image.jpg").read_bytes() == body